@@ -1,40 +1,96 @@
-
 #!/usr/bin/env python3
-import math, json, argparse, random, statistics, os
+import math, json, argparse, os, itertools
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+import sys, pathlib
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[3] / "UFRF-ToE-ProofKit-v8" / "src"))
+from ufrf.projection.streaming import RunningMoments, HistogramSketch
 
-def sample_alpha():
+A_LO, A_HI = 0.05, 0.7
+QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+def sample_alpha(rng, size):
     # sample technique components in [0,1] with mild bias near bands seen in docs
-    aE = random.uniform(0.05, 0.7)
-    aB = random.uniform(0.05, 0.7)
-    return (aE, aB, math.sqrt(aE*aE + aB*aB))
+    aE = rng.uniform(A_LO, A_HI, size)
+    aB = rng.uniform(A_LO, A_HI, size)
+    return aE, aB, np.hypot(aE, aB)
+
+def lnO_range(Ostar, dM, S, eps_sigma):
+    # alpha_total lies in [sqrt2*A_LO, sqrt2*A_HI]; pad by 10 sigma of noise
+    ends = [math.log(Ostar) + dM*a*S for a in (math.sqrt(2)*A_LO, math.sqrt(2)*A_HI)]
+    pad = 10*eps_sigma + 1e-12
+    return min(ends) - pad, max(ends) + pad
 
 def run_mc(n, Ostar, dM, S, eps_sigma=1e-6, seed=12345):
-    random.seed(seed)
-    obs = []
-    alphas = []
-    for _ in range(n):
-        aE,aB,atot = sample_alpha()
-        lnO = math.log(Ostar) + dM*atot*S + random.gauss(0.0, eps_sigma)
-        O = math.exp(lnO)
-        obs.append(O)
-        alphas.append(atot)
-    return obs, alphas
+    # all n samples at once; use run_mc_stats for large n
+    rng = np.random.default_rng(seed)
+    _, _, atot = sample_alpha(rng, n)
+    O = np.exp(math.log(Ostar) + dM*atot*S + rng.normal(0.0, eps_sigma, n))
+    return O, atot
+
+def run_mc_stats(n, Ostar, dM, S, eps_sigma=1e-6, seed=12345, chunk=1 << 20, bins=1 << 14):
+    # streaming: blocks of `chunk` samples into mergeable moments and a ln O quantile sketch
+    rng = np.random.default_rng(seed)
+    mom_O, mom_a = RunningMoments(), RunningMoments()
+    sketch = HistogramSketch(*lnO_range(Ostar, dM, S, eps_sigma), bins=bins)
+    lnOstar = math.log(Ostar)
+    for start in range(0, n, chunk):
+        m = min(chunk, n - start)
+        _, _, atot = sample_alpha(rng, m)
+        lnO = lnOstar + dM*S*atot + rng.normal(0.0, eps_sigma, m)
+        mom_O.update(np.exp(lnO)); mom_a.update(atot); sketch.update(lnO)
+    return mom_O, mom_a, sketch
+
+def _worker(job):
+    return run_mc_stats(*job)
+
+def run_mc_parallel(n, Ostar, dM, S, eps_sigma=1e-6, seed=12345, workers=1, chunk=1 << 20, bins=1 << 14):
+    # independent SeedSequence streams per worker; partial statistics are merged
+    if workers <= 1:
+        return run_mc_stats(n, Ostar, dM, S, eps_sigma, seed, chunk, bins)
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    shares = [n//workers + (i < n % workers) for i in range(workers)]
+    jobs = [(k, Ostar, dM, S, eps_sigma, ss, chunk, bins) for k, ss in zip(shares, seeds)]
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        parts = list(ex.map(_worker, jobs))
+    mom_O, mom_a, sketch = parts[0]
+    for o, a, sk in parts[1:]:
+        mom_O.merge(o); mom_a.merge(a); sketch.merge(sk)
+    return mom_O, mom_a, sketch
+
+def summarize(mom_O, mom_a, sketch):
+    qs = np.exp(sketch.quantile(QUANTILES))
+    return {"n": mom_O.n, "mean_O": mom_O.mean, "std_O": mom_O.std, "sem_O": mom_O.sem,
+            "quantiles_O": {str(q): float(v) for q, v in zip(QUANTILES, qs)},
+            "lnO_bin_width": sketch.width,
+            "alphas_stats": {"mean": mom_a.mean, "min": mom_a.min, "max": mom_a.max}}
 
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--n", type=int, default=2000)
     ap.add_argument("--Ostar", type=float, default=1.0)
-    ap.add_argument("--dM", type=float, default=6.907, help="~ln(1000) for 144k vs 144")
-    ap.add_argument("--S", type=float, default=-0.10)
+    ap.add_argument("--dM", type=float, nargs="+", default=[6.907], help="~ln(1000) for 144k vs 144")
+    ap.add_argument("--S", type=float, nargs="+", default=[-0.10])
+    ap.add_argument("--eps-sigma", type=float, default=1e-6)
+    ap.add_argument("--seed", type=int, default=12345)
+    ap.add_argument("--chunk", type=int, default=1 << 20)
+    ap.add_argument("--workers", type=int, default=1)
     args = ap.parse_args()
 
-    obs, alphas = run_mc(args.n, args.Ostar, args.dM, args.S)
-    mu = statistics.mean(obs); sd = statistics.pstdev(obs)
-    print(f"n={args.n}  mean(O)={mu:.9f}  std={sd:.3e}")
-    print(f"alpha_total: mean={statistics.mean(alphas):.3f}, min={min(alphas):.3f}, max={max(alphas):.3f}")
+    results = []
+    for dM, S in itertools.product(args.dM, args.S):
+        res = summarize(*run_mc_parallel(args.n, args.Ostar, dM, S, args.eps_sigma, args.seed,
+                                         args.workers, args.chunk))
+        res.update(dM=dM, S=S)
+        results.append(res)
+        a = res["alphas_stats"]
+        print(f"dM={dM} S={S}  n={args.n}  mean(O)={res['mean_O']:.9f}  std={res['std_O']:.3e}  "
+              f"median={res['quantiles_O']['0.5']:.9f}")
+        print(f"alpha_total: mean={a['mean']:.3f}, min={a['min']:.3f}, max={a['max']:.3f}")
     os.makedirs("artifacts", exist_ok=True)
     with open("artifacts/projection_mc.json","w") as f:
-        json.dump({"mean_O":mu,"std_O":sd,"alphas_stats":{"mean":statistics.mean(alphas),"min":min(alphas),"max":max(alphas)}}, f, indent=2)
+        json.dump(results[0] if len(results) == 1 else {"settings": results}, f, indent=2)
     print("Saved artifacts/projection_mc.json")
 
 if __name__ == "__main__":
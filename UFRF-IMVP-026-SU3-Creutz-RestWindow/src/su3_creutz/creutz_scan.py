@@ -1,103 +1,93 @@
 #!/usr/bin/env python3
-import numpy as np, math, argparse, json, os
+import numpy as np, argparse, json, os, hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-import numpy as np
+import sys, pathlib
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[3] / "UFRF-ToE-ProofKit-v8" / "src"))
+from ufrf.ym import lattice
+from ufrf.ym.lattice import WilsonLoopEngine
 
-def gell_mann():
-    Z = np.zeros((3,3), dtype=complex)
-    l1 = Z.copy(); l1[0,1]=l1[1,0]=1
-    l2 = Z.copy(); l2[0,1]=-1j; l2[1,0]=1j
-    l3 = Z.copy(); l3[0,0]=1; l3[1,1]=-1
-    l4 = Z.copy(); l4[0,2]=l4[2,0]=1
-    l5 = Z.copy(); l5[0,2]=-1j; l5[2,0]=1j
-    l6 = Z.copy(); l6[1,2]=l6[2,1]=1
-    l7 = Z.copy(); l7[1,2]=-1j; l7[2,1]=1j
-    l8 = (1/np.sqrt(3))*np.diag([1,1,-2]).astype(complex)
-    return [l1,l2,l3,l4,l5,l6,l7,l8]
+AMPS = (0.18, 0.15, 0.12, 0.09, 0.07, 0.05, 0.04, 0.03)
 
-LAM = gell_mann()
+def build_links(N, period=13, eps=0.12, seed=5):
+    return lattice.build_links(N, period=period, eps=eps, seed=seed, amps=AMPS)
 
-def su3_expm_from_theta(theta):
-    """
-    Near-identity exponential map using 4th-order series + polar reunitarization.
-    U = exp(i G), with G = sum_a theta[a] * lambda_a / 2
-    """
-    G = sum(theta[a]*LAM[a] for a in range(8)) / 2.0
-    iG = 1j*G
-    I = np.eye(3, dtype=complex)
-    # 4th-order Taylor
-    X = I + iG + 0.5*(iG@iG) + (1/6.0)*(iG@iG@iG) + (1/24.0)*(iG@iG@iG@iG)
-    # Polar projection to SU(3)
-    Uu, s, Vh = np.linalg.svd(X)
-    Q = Uu @ Vh
-    det = np.linalg.det(Q)
-    Q /= det**(1/3)
-    return Q
+def creutz_ratio(engine,L):
+    # square Creutz ratio χ(L,L); the four rectangles share the engine's cached transporters
+    return engine.creutz_ratio(L, L)
 
+EPS_GRID = [1.0, 0.5, 0.2, 0.1, 0.05]
 
-def build_links(N, period=13, eps=0.12, seed=5):
-    rng = np.random.default_rng(seed)
-    Ux = [[np.eye(3,dtype=complex) for _ in range(N)] for _ in range(N)]
-    Uy = [[np.eye(3,dtype=complex) for _ in range(N)] for _ in range(N)]
-    for y in range(N):
-        for x in range(N):
-            phase = 2.0*math.pi*(x+y)/float(period)
-            base = np.array([
-                0.18*np.sin(phase), 0.15*np.cos(phase), 0.12*np.sin(2*phase),
-                0.09*np.cos(2*phase), 0.07*np.sin(3*phase), 0.05*np.cos(3*phase),
-                0.04*np.sin(4*phase), 0.03*np.cos(4*phase)
-            ]) * eps
-            thx = base + 0.02*rng.standard_normal(8)
-            thy = 0.9*base + 0.02*rng.standard_normal(8)
-            Ux[y][x] = su3_expm_from_theta(thx)
-            Uy[y][x] = su3_expm_from_theta(thy)
-    return Ux, Uy
+# bump whenever build_links, the SU(3) exponential map or WilsonLoopEngine change results;
+# it is part of the cache key and stored in every result, so stale cache entries are never served
+CACHE_VERSION = 2
 
-def idx(a,N): return a % N
+def config_key(cfg):
+    payload = {"cache_version": CACHE_VERSION, **cfg}
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:16]
 
-def WilsonLoop(Ux,Uy,x0,y0,R,T):
-    N = len(Ux)
-    def Idx(a): return a % N
-    U = np.eye(3, dtype=complex)
-    x,y = x0,y0
-    for _ in range(R):
-        U = U @ Ux[Idx(y)][Idx(x)]; x += 1
-    for _ in range(T):
-        U = U @ Uy[Idx(y)][Idx(x)]; y += 1
-    for _ in range(R):
-        x -= 1; U = U @ Ux[Idx(y)][Idx(x)].conj().T
-    for _ in range(T):
-        y -= 1; U = U @ Uy[Idx(y)][Idx(x)].conj().T
-    return U
+def run_config(cfg):
+    Ux,Uy = build_links(cfg["N"],period=cfg["period"],eps=cfg["eps"],seed=cfg["seed"])
+    engine = WilsonLoopEngine(Ux,Uy)
+    chis = [creutz_ratio(engine,L) for L in range(1,cfg["Lmax"]+1)]
+    return dict(cfg, chi=chis, cache_version=CACHE_VERSION)
 
-def avg_W(Ux,Uy,R,T):
-    N = len(Ux)
-    tot = 0.0
-    for y in range(N):
-        for x in range(N):
-            U = WilsonLoop(Ux,Uy,x,y,R,T)
-            tot += (np.trace(U)/3.0).real
-    return tot/(N*N)
+def _store(cache_dir, cfg, res):
+    path = os.path.join(cache_dir, config_key(cfg)+".json")
+    with open(path+".tmp","w") as f:
+        json.dump(res, f)
+    os.replace(path+".tmp", path)
 
-def creutz_ratio(Ux,Uy,L):
-    # square Creutz ratio χ(L,L)
-    WLL     = avg_W(Ux,Uy,L,L)
-    WpLpL   = avg_W(Ux,Uy,L+1,L+1)
-    WpLL    = avg_W(Ux,Uy,L+1,L)
-    WLpL    = avg_W(Ux,Uy,L,L+1)
-    num = WpLpL * WLL
-    den = WpLL * WLpL
-    if den <= 0 or num <= 0:
-        return float('nan')
-    return -math.log(num/den)
+def sweep(eps=EPS_GRID, periods=(13,), seeds=(5,), Ns=(18,), Lmax=7, workers=None, cache_dir="artifacts/creutz_cache"):
+    # one configuration per (N, period, eps, seed); results already in cache_dir are reused,
+    # the rest run on a process pool (workers=1 runs serially, cache_dir=None disables the cache)
+    grid = [{"N":N,"period":p,"eps":e,"seed":sd,"Lmax":Lmax} for N in Ns for p in periods for e in eps for sd in seeds]
+    done, todo = {}, []
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    for cfg in grid:
+        path = os.path.join(cache_dir, config_key(cfg)+".json") if cache_dir else None
+        res = None
+        if path and os.path.exists(path):
+            with open(path) as f:
+                res = json.load(f)
+        if res is not None and res.get("cache_version") == CACHE_VERSION:
+            done[config_key(cfg)] = res
+        else:
+            todo.append(cfg)
+    def record(cfg, res):
+        done[config_key(cfg)] = res
+        if cache_dir:
+            _store(cache_dir, cfg, res)
+    if workers == 1 or len(todo) <= 1:
+        for cfg in todo:
+            record(cfg, run_config(cfg))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futs = {ex.submit(run_config, cfg): cfg for cfg in todo}
+            for fut in as_completed(futs):
+                record(futs[fut], fut.result())
+    return [done[config_key(cfg)] for cfg in grid]
 
-def scan(N=18,Lmax=7,period=13):
+def summarize(results):
+    # seed-ensemble mean and standard error of χ(L) for every (N, period, eps)
+    groups = {}
+    for r in results:
+        groups.setdefault((r["N"],r["period"],r["eps"]), []).append(r["chi"])
     out = []
-    for eps in [1.0, 0.5, 0.2, 0.1, 0.05]:
-        Ux,Uy = build_links(N,period=period,eps=eps)
-        chis = [creutz_ratio(Ux,Uy,L) for L in range(1,Lmax+1)]
-        out.append({"eps":eps,"chi":chis,"mean":np.nanmean(chis)})
-        print(f"ε={eps:4.2f}  χ(L=1..{Lmax}) = " + ", ".join(f"{c:.4f}" if c==c else "nan" for c in chis))
+    for (N,p,e), chis in groups.items():
+        C = np.array(chis, dtype=float)
+        n = np.sum(~np.isnan(C), axis=0)
+        mean = np.nanmean(C, axis=0)
+        sem = np.nanstd(C, axis=0, ddof=1)/np.sqrt(n) if len(chis) > 1 else np.full(C.shape[1], np.nan)
+        out.append({"N":N,"period":p,"eps":e,"n_seeds":len(chis),"chi":mean.tolist(),
+                    "chi_sem":sem.tolist(),"mean":float(np.nanmean(mean))})
+    return out
+
+def scan(N=18,Lmax=7,period=13,eps=EPS_GRID,seeds=(5,),workers=1,cache_dir=None):
+    out = summarize(sweep(eps=eps,periods=(period,),seeds=seeds,Ns=(N,),Lmax=Lmax,workers=workers,cache_dir=cache_dir))
+    for r in out:
+        print(f"ε={r['eps']:4.2f}  χ(L=1..{Lmax}) = " + ", ".join(f"{c:.4f}" if c==c else "nan" for c in r["chi"]))
     return out
 
 def main():
@@ -105,8 +95,13 @@ def main():
     ap.add_argument("--N", type=int, default=18)
     ap.add_argument("--Lmax", type=int, default=7)
     ap.add_argument("--period", type=int, default=13)
+    ap.add_argument("--eps", type=float, nargs="+", default=EPS_GRID)
+    ap.add_argument("--seeds", type=int, default=1, help="Seed-ensemble size per ε (seeds 5, 6, ...).")
+    ap.add_argument("--workers", type=int, default=None, help="Process-pool size (default: CPU count).")
+    ap.add_argument("--cache-dir", default="artifacts/creutz_cache")
     args = ap.parse_args()
-    res = scan(N=args.N,Lmax=args.Lmax,period=args.period)
+    res = scan(N=args.N,Lmax=args.Lmax,period=args.period,eps=args.eps,seeds=tuple(range(5, 5+args.seeds)),
+               workers=args.workers,cache_dir=args.cache_dir)
     os.makedirs("artifacts", exist_ok=True)
     with open("artifacts/su3_creutz_scan.json","w") as f:
         json.dump({"N":args.N,"Lmax":args.Lmax,"period":args.period,"results":res}, f, indent=2)
@@ -1,4 +1,8 @@
 import numpy as np
+import sys, pathlib
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[3] / "UFRF-ToE-ProofKit-v8" / "src"))
+from ufrf.projection.fit import fit_projection_batch
+
 
 def fit_projection(scales, observations, alphas, S_guess=-0.05):
     """Linearize ln O = ln O* + d_M * α * S + ε and solve least squares.
@@ -6,19 +10,16 @@ def fit_projection(scales, observations, alphas, S_guess=-0.05):
     observations: array of O (positive)
     alphas: array of technique α in [0,1]
     Returns dict with O_star, S, stderr
+    For many datasets at once (bootstrap replicates etc.) use fit_projection_batch,
+    which also returns se_S, se_lnO_star and the 2x2 covariance.
     """
     scales = np.asarray(scales, dtype=float)
     obs = np.asarray(observations, dtype=float)
     alphas = np.asarray(alphas, dtype=float)
     assert np.all(obs>0), "Observations must be positive for log."
-    y = np.log(obs)
-    X = np.column_stack([np.ones_like(scales), alphas*np.log(scales)])
-    # Solve y = c0 + c1 * (α ln r)  ⇒ c0 = ln O*, c1 = S
-    coef, *_ = np.linalg.lstsq(X, y, rcond=None)
-    lnOstar, S = coef
-    residuals = y - X @ coef
-    stderr = np.sqrt(np.mean(residuals**2))
-    return {"O_star": float(np.exp(lnOstar)), "S": float(S), "stderr": float(stderr)}
+    # Solve y = c0 + c1 * (α ln r)  ⇒ c0 = ln O*, c1 = S  (closed-form 2x2 normal equations)
+    fit = fit_projection_batch(scales, obs, alphas)
+    return {"O_star": float(fit["O_star"]), "S": float(fit["S"]), "stderr": float(fit["stderr"])}
 
 def demo_synthetic(n=30, O_star=2.0, S=-0.06, rng=0):
     """Generate synthetic data at random scale ratios and techniques, then fit."""
@@ -6,9 +6,22 @@ and look for gaps/shells in the data
 
 import numpy as np
 import re
-from collections import defaultdict
 
-def parse_ame2020(filename):
+import sys, pathlib
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[4] / "UFRF-ToE-ProofKit-v8" / "src"))
+from ufrf.nuclear.ame2020 import load_ame2020, experimental
+from ufrf.nuclear.chart import NuclideChart
+
+def load_nuclides(filename, cache_dir=None):
+    """
+    AME 2020 mass table as a structured array (Z, N, A, element, mass_excess,
+    binding_per_A, binding_total, flags), parsed once and then loaded from a
+    binary cache keyed by the file's SHA-1 (see ufrf.nuclear.ame2020).
+    Estimated ('#') and non-calculable ('*') entries are kept and flagged.
+    """
+    return load_ame2020(filename, cache_dir=cache_dir)
+
+def parse_ame2020(filename, cache_dir=None):
     """
     Parse AME 2020 mass file
     
@@ -16,128 +29,82 @@ def parse_ame2020(filename):
     cc NZ  N  Z  A    el  o     mass  unc binding unc      B  beta  unc    atomic_mass   unc
     
     Returns:
-        list of dicts with nuclear data
+        list of dicts with nuclear data (experimental values only)
     """
     nuclides = []
     
-    with open(filename, 'r') as f:
-        for line in f:
-            # Skip header lines and short lines
-            if len(line) < 100:
-                continue
-            # Data lines start with spaces and numbers, skip lines starting with 0 or 1 (page/line feed)
-            if line[0] in ['0', '1']:
-                continue
-                
-            try:
-                # Parse fixed-width format
-                nz = int(line[0:4])
-                N = int(line[4:9])
-                Z = int(line[9:14])
-                A = int(line[14:19])
-                el = line[20:23].strip()
-                
-                # Mass excess (keV)
-                mass_excess_str = line[29:43].strip()
-                if '#' in mass_excess_str or '*' in mass_excess_str:
-                    continue  # Skip estimated/non-calculable values
-                mass_excess = float(mass_excess_str)
-                
-                # Binding energy per nucleon (keV)
-                binding_per_A_str = line[54:67].strip()
-                if '#' in binding_per_A_str or '*' in binding_per_A_str:
-                    continue
-                binding_per_A = float(binding_per_A_str)
-                
-                # Total binding energy (keV)
-                binding_total = binding_per_A * A
-                
-                nuclides.append({
-                    'N': N,
-                    'Z': Z,
-                    'A': A,
-                    'element': el,
-                    'mass_excess': mass_excess,  # keV
-                    'binding_per_A': binding_per_A,  # keV
-                    'binding_total': binding_total,  # keV
-                })
-                
-            except (ValueError, IndexError):
-                continue
+    for row in experimental(load_nuclides(filename, cache_dir)):
+        nuclides.append({
+            'N': int(row['N']),
+            'Z': int(row['Z']),
+            'A': int(row['A']),
+            'element': str(row['element']),
+            'mass_excess': float(row['mass_excess']),  # keV
+            'binding_per_A': float(row['binding_per_A']),  # keV
+            'binding_total': float(row['binding_total']),  # keV
+        })
     
     return nuclides
 
+def nuclide_chart(nuclides):
+    """Dense (Z, N) chart from a structured array or a list of nuclide dicts"""
+    if isinstance(nuclides, np.ndarray):
+        return NuclideChart.from_table(nuclides)
+    return NuclideChart([n['Z'] for n in nuclides], [n['N'] for n in nuclides],
+                        [n['binding_total'] for n in nuclides], [n['element'] for n in nuclides])
+
 def compute_separation_energies(nuclides):
     """
     Compute neutron/proton separation energies
     
     S_n(Z,N) = BE(Z,N) - BE(Z,N-1)  (neutron separation energy)
     S_p(Z,N) = BE(Z,N) - BE(Z-1,N)  (proton separation energy)
+    
+    Evaluated as shifted differences on the dense chart (ufrf.nuclear.chart),
+    which also provides S_2n and S_2p.
     """
-    # Create lookup by (Z, N)
-    be_lookup = {}
-    for nuc in nuclides:
-        be_lookup[(nuc['Z'], nuc['N'])] = nuc['binding_total']
+    chart = nuclide_chart(nuclides)
+    Z = np.array([nuc['Z'] for nuc in nuclides]); N = np.array([nuc['N'] for nuc in nuclides])
+    S_n = chart.separation('n')[Z, N]
+    S_p = chart.separation('p')[Z, N]
     
-    # Compute separation energies
-    for nuc in nuclides:
-        Z, N = nuc['Z'], nuc['N']
-        
-        # Neutron separation energy
-        if (Z, N-1) in be_lookup:
-            nuc['S_n'] = be_lookup[(Z, N)] - be_lookup[(Z, N-1)]
-        else:
-            nuc['S_n'] = None
-            
-        # Proton separation energy
-        if (Z-1, N) in be_lookup:
-            nuc['S_p'] = be_lookup[(Z, N)] - be_lookup[(Z-1, N)]
-        else:
-            nuc['S_p'] = None
+    for nuc, sn, sp in zip(nuclides, S_n, S_p):
+        nuc['S_n'] = None if np.isnan(sn) else float(sn)
+        nuc['S_p'] = None if np.isnan(sp) else float(sp)
     
     return nuclides
 
-def find_shell_gaps(nuclides, min_gap_mev=10.0):
+def find_shell_gaps(nuclides, min_gap_mev=10.0, kind='n'):
     """
     Find significant gaps in separation energies that indicate shell closures
     
     Args:
-        nuclides: List of nuclide data
+        nuclides: List of nuclide data (or the structured array from load_nuclides)
         min_gap_mev: Minimum gap size in MeV to report
+        kind: 'n', '2n' (along isotopes) or 'p', '2p' (along isotones)
     
     Returns:
         List of detected gaps
     """
-    gaps = []
+    chart = nuclide_chart(nuclides)
+    return gap_records(chart, chart.gaps(kind, min_gap_mev), kind)
+
+def gap_records(chart, g, kind='n'):
+    """Gap dicts (as returned by find_shell_gaps) from NuclideChart gap columns"""
+    fixed, moving = ('Z', 'N') if kind in ('n', '2n') else ('N', 'Z')
     
-    # Group by Z (isotopes)
-    by_z = defaultdict(list)
-    for nuc in nuclides:
-        if nuc['S_n'] is not None:
-            by_z[nuc['Z']].append(nuc)
-    
-    # Look for drops in S_n (shell closure)
-    for Z in sorted(by_z.keys()):
-        isotopes = sorted(by_z[Z], key=lambda x: x['N'])
-        
-        for i in range(len(isotopes) - 1):
-            curr = isotopes[i]
-            next_iso = isotopes[i+1]
-            
-            # Gap = drop in separation energy
-            gap = curr['S_n'] - next_iso['S_n']
-            gap_mev = gap / 1000.0  # Convert keV to MeV
-            
-            if gap_mev >= min_gap_mev:
-                gaps.append({
-                    'Z': Z,
-                    'element': curr['element'],
-                    'N_before': curr['N'],
-                    'N_after': next_iso['N'],
-                    'S_n_before': curr['S_n'] / 1000.0,  # MeV
-                    'S_n_after': next_iso['S_n'] / 1000.0,  # MeV
-                    'gap_mev': gap_mev,
-                })
+    gaps = []
+    for i in range(len(g['gap_mev'])):
+        chain = int(g['chain'][i])
+        gaps.append({
+            fixed: chain,
+            'element': str(chart.element[chain]) if fixed == 'Z' else None,
+            f'{moving}_before': int(g['before'][i]),
+            f'{moving}_after': int(g['after'][i]),
+            f'S_{kind}_before': float(g['S_before'][i]),  # MeV
+            f'S_{kind}_after': float(g['S_after'][i]),  # MeV
+            'gap_mev': float(g['gap_mev'][i]),
+        })
     
     return gaps
 
@@ -157,7 +124,8 @@ def main():
     
     # Find shell gaps
     print("\nSearching for shell gaps (≥10 MeV)...")
-    gaps = find_shell_gaps(nuclides, min_gap_mev=10.0)
+    chart = nuclide_chart(nuclides)
+    gaps = gap_records(chart, chart.gaps('n', 10.0))
     
     print(f"\nFound {len(gaps)} significant gaps (≥10 MeV)")
     print("\nTop 20 largest gaps:")
@@ -175,7 +143,7 @@ def main():
     print("Gaps near 14.0 ± 0.25 MeV (UFRF prediction range: 13.75-14.25 MeV)")
     print("=" * 70)
     
-    ufrf_gaps = [g for g in gaps if 13.75 <= g['gap_mev'] <= 14.25]
+    ufrf_gaps = gap_records(chart, chart.gap_window('n', 13.75, 14.25))
     
     if ufrf_gaps:
         print(f"\nFound {len(ufrf_gaps)} gaps in UFRF prediction range:")
@@ -1,5 +1,8 @@
 
 import numpy as np, math
+import sys, pathlib
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[3] / "UFRF-ToE-ProofKit-v8" / "src"))
+from ufrf.ym.lattice import su3_expm_from_theta
 
 def su2_f():
     f = np.zeros((3,3,3), dtype=float)
@@ -49,13 +52,5 @@ def gell_mann():
     return [l1,l2,l3,l4,l5,l6,l7,l8]
 
 def su3_exp_from_theta(theta):
-    LAM = gell_mann()
-    G = sum(theta[a]*LAM[a] for a in range(8))/2.0
-    iG = 1j*G
-    I = np.eye(3, dtype=complex)
-    X = I + iG + 0.5*(iG@iG) + (1/6.0)*(iG@iG@iG) + (1/24.0)*(iG@iG@iG@iG)
-    U,S,Vh = np.linalg.svd(X)
-    Q = U @ Vh
-    det = np.linalg.det(Q)
-    Q /= det**(1/3)
-    return Q
+    # exact closed-form exp(i theta·lambda/2); theta may be a single 8-vector or a (..., 8) batch
+    return su3_expm_from_theta(theta)
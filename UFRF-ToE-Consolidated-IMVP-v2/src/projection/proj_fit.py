@@ -1,13 +1,11 @@
 
 import numpy as np
+import sys, pathlib
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[3] / "UFRF-ToE-ProofKit-v8" / "src"))
+from ufrf.projection.fit import fit_projection_batch
 def fit_projection(scales, observations, alphas):
-    scales = np.asarray(scales, float); obs = np.asarray(observations, float); alphas = np.asarray(alphas, float)
-    y = np.log(obs)
-    X = np.column_stack([np.ones_like(scales), alphas*np.log(scales)])
-    coef, *_ = np.linalg.lstsq(X, y, rcond=None)
-    lnOstar, S = coef
-    residuals = y - X@coef
-    return np.exp(lnOstar), S, float(np.sqrt(np.mean(residuals**2)))
+    fit = fit_projection_batch(scales, observations, alphas)
+    return float(fit["O_star"]), float(fit["S"]), float(fit["stderr"])
 def demo(n=40, Ostar=1.37, S=-0.05, seed=0):
     rng = np.random.default_rng(seed)
     r = np.exp(rng.uniform(-3,3,size=n))
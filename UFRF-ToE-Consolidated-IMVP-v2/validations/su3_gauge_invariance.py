@@ -2,29 +2,8 @@
 import numpy as np, math
 from src.gauge.su_groups import su3_exp_from_theta
 
-def gell_mann():
-    Z = np.zeros((3,3), dtype=complex)
-    l1 = Z.copy(); l1[0,1]=l1[1,0]=1
-    l2 = Z.copy(); l2[0,1]=-1j; l2[1,0]=1j
-    l3 = Z.copy(); l3[0,0]=1; l3[1,1]=-1
-    l4 = Z.copy(); l4[0,2]=l4[2,0]=1
-    l5 = Z.copy(); l5[0,2]=-1j; l5[2,0]=1j
-    l6 = Z.copy(); l6[1,2]=l6[2,1]=1
-    l7 = Z.copy(); l7[1,2]=-1j; l7[2,1]=1j
-    l8 = (1/np.sqrt(3))*np.diag([1,1,-2]).astype(complex)
-    return [l1,l2,l3,l4,l5,l6,l7,l8]
-
 def build_links(N=16, period=13, eps=0.12, seed=7):
     rng = np.random.default_rng(seed)
-    LAM = gell_mann()
-    def exp_from_theta(theta):
-        G = sum(theta[a]*LAM[a] for a in range(8))/2.0
-        iG = 1j*G
-        I = np.eye(3, dtype=complex)
-        X = I + iG + 0.5*(iG@iG) + (1/6.0)*(iG@iG@iG) + (1/24.0)*(iG@iG@iG@iG)
-        U,S,Vh = np.linalg.svd(X); Q = U@Vh
-        det = np.linalg.det(Q); Q/=det**(1/3)
-        return Q
     Ux = [[np.eye(3,dtype=complex) for _ in range(N)] for _ in range(N)]
     Uy = [[np.eye(3,dtype=complex) for _ in range(N)] for _ in range(N)]
     for y in range(N):
@@ -35,8 +14,8 @@ def build_links(N=16, period=13, eps=0.12, seed=7):
                              0.05*np.sin(4*phase), 0.04*np.cos(4*phase)]) * eps
             thx = base + 0.02*rng.standard_normal(8)
             thy = 0.9*base + 0.02*rng.standard_normal(8)
-            Ux[y][x] = exp_from_theta(thx)
-            Uy[y][x] = exp_from_theta(thy)
+            Ux[y][x] = su3_exp_from_theta(thx)
+            Uy[y][x] = su3_exp_from_theta(thy)
     return Ux,Uy
 
 def wilson_loop(Ux,Uy,x0,y0,L):
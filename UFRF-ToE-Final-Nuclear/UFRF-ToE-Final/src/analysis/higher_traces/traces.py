@@ -24,6 +24,7 @@ Key Results:
 import numpy as np
 from scipy.special import comb
 from itertools import combinations
+from fractions import Fraction
 from typing import List, Tuple, Dict
 import warnings
 
@@ -68,7 +69,43 @@ def exterior_power(A: np.ndarray, k: int) -> np.ndarray:
     return Lambda_k_A
 
 
-def higher_trace(A: np.ndarray, k: int) -> float:
+def characteristic_traces(A: np.ndarray, exact: bool = False) -> np.ndarray:
+    """
+    Compute [λ_0, ..., λ_N] from the characteristic polynomial in O(N³)
+    
+    λ_k(A) = e_k(μ_1, ..., μ_N), the k-th elementary symmetric polynomial of
+    the eigenvalues, read off det(tI - A) = Σ_k (-1)^k λ_k t^{N-k}.
+    
+    With exact=True the coefficients come from the Faddeev–LeVerrier recursion
+    M_k = A M_{k-1} + c_{N-k+1} I,  c_{N-k} = -tr(A M_k)/k
+    in rational arithmetic, so integer operators give exact Fraction results.
+    
+    Args:
+        A: N×N matrix
+        exact: Use exact Fraction arithmetic instead of eigenvalues
+    
+    Returns:
+        Array [λ_0, λ_1, ..., λ_N] (dtype=object of Fractions if exact)
+    """
+    N = A.shape[0]
+    if not exact:
+        coeffs = np.poly(A) * (-1.0) ** np.arange(N + 1)
+        return coeffs.real if np.isrealobj(A) else coeffs
+    
+    Aq = [[Fraction(x) for x in row] for row in np.asarray(A).tolist()]
+    M = [[Fraction(0)] * N for _ in range(N)]
+    c = Fraction(1)
+    lambdas = [Fraction(1)]
+    for k in range(1, N + 1):
+        # M_k = A M_{k-1} + c_{N-k+1} I
+        M = [[sum(Aq[i][l] * M[l][j] for l in range(N)) + (c if i == j else 0)
+              for j in range(N)] for i in range(N)]
+        c = -sum(sum(Aq[i][l] * M[l][i] for l in range(N)) for i in range(N)) / k
+        lambdas.append((-1) ** k * c)
+    return np.array(lambdas, dtype=object)
+
+
+def higher_trace(A: np.ndarray, k: int, method: str = "charpoly") -> float:
     """
     Compute λ_k(A) = tr(Λ^k A)
     
@@ -80,15 +117,21 @@ def higher_trace(A: np.ndarray, k: int) -> float:
     Args:
         A: N×N matrix
         k: Order (1 ≤ k ≤ N)
+        method: "charpoly" (O(N³), default), "exact" (rational Faddeev–LeVerrier)
+            or "exterior" (trace of the explicit Λ^k A, C(N,k)² determinants)
     
     Returns:
         λ_k(A)
     """
-    Lambda_k_A = exterior_power(A, k)
-    return np.trace(Lambda_k_A)
+    N = A.shape[0]
+    if k < 1 or k > N:
+        raise ValueError(f"k must be between 1 and {N}, got {k}")
+    if method == "exterior":
+        return np.trace(exterior_power(A, k))
+    return compute_all_higher_traces(A, method)[k]
 
 
-def compute_all_higher_traces(A: np.ndarray) -> np.ndarray:
+def compute_all_higher_traces(A: np.ndarray, method: str = "charpoly") -> np.ndarray:
     """
     Compute λ_k(A) for all k = 0, 1, ..., N
     
@@ -97,25 +140,86 @@ def compute_all_higher_traces(A: np.ndarray) -> np.ndarray:
     
     Args:
         A: N×N matrix
+        method: "charpoly" (default), "exact" or "exterior" (see higher_trace)
     
     Returns:
         Array [λ_0, λ_1, ..., λ_N] where λ_0 = 1
     """
+    if method == "charpoly":
+        return characteristic_traces(A)
+    if method == "exact":
+        return characteristic_traces(A, exact=True)
+    if method != "exterior":
+        raise ValueError(f"unknown method {method!r}; expected 'charpoly', 'exact' or 'exterior'")
+    
     N = A.shape[0]
     lambdas = [1.0]  # λ_0 = 1
     
     for k in range(1, N+1):
-        lambdas.append(higher_trace(A, k))
+        lambdas.append(higher_trace(A, k, method="exterior"))
     
     return np.array(lambdas)
 
 
-def test_isotropy_cone_measure(A: np.ndarray, num_samples: int = 10000) -> Tuple[np.ndarray, float]:
+def _sphere_chunks(dim: int, num_samples: int, chunk_size: int, rng: np.random.Generator):
+    """Yield blocks of at most chunk_size uniform unit vectors in R^dim (cone measure)."""
+    for start in range(0, num_samples, chunk_size):
+        w = rng.standard_normal((min(chunk_size, num_samples - start), dim))
+        w /= np.linalg.norm(w, axis=1, keepdims=True)
+        yield w
+
+
+def isotropy_monte_carlo(N: int, num_samples: int = 10000, chunk_size: int = 100000,
+                         rng: np.random.Generator = None) -> Dict:
+    """
+    Chunked estimator of T_η = n_k ∫ w ⊗ w* dη for the cone measure on S^{N-1}
+    
+    With n_k = N the isotropic limit is T_η = I (∫ w ⊗ w* dη = I/N), so error → 0
+    as num_samples grows. Each chunk contributes samples.T @ samples to a running
+    sum (and the squared samples to the second moment), so memory is
+    O(chunk_size·N) for any num_samples.
+    
+    Args:
+        N: Dimension
+        num_samples: Number of samples
+        chunk_size: Samples drawn per vectorised block
+        rng: Random generator (default: fresh np.random.default_rng())
+    
+    Returns:
+        Dictionary with T_eta, error = ||T_eta - I||_F, std_error (entrywise
+        standard error of T_eta) and convergence [(n, error, max std_error)] per chunk
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    S1 = np.zeros((N, N))
+    S2 = np.zeros((N, N))
+    n = 0
+    convergence = []
+    I_N = np.eye(N)
+    for w in _sphere_chunks(N, num_samples, chunk_size, rng):
+        S1 += w.T @ w
+        w2 = w * w
+        S2 += w2.T @ w2
+        n += len(w)
+        T_eta = N * S1 / n
+        se = N * np.sqrt(np.maximum(S2 / n - (S1 / n)**2, 0.0) / max(n - 1, 1))
+        convergence.append((n, float(np.linalg.norm(T_eta - I_N, 'fro')), float(se.max())))
+    
+    return {
+        'T_eta': T_eta,
+        'error': convergence[-1][1],
+        'std_error': se,
+        'convergence': convergence
+    }
+
+
+def test_isotropy_cone_measure(A: np.ndarray, num_samples: int = 10000, chunk_size: int = 100000,
+                               rng: np.random.Generator = None) -> Tuple[np.ndarray, float]:
     """
     Test isotropy T_η = I using cone probability measure
     
     For cone measure, isotropy holds automatically by Gauss-Green theorem.
-    This function verifies it numerically.
+    This function verifies it numerically, with T_η normalised by n_k = N
+    (see isotropy_monte_carlo for the standard errors and convergence trace).
     
     T_η = n_k ∫ w ⊗ w* dη
     
@@ -124,30 +228,52 @@ def test_isotropy_cone_measure(A: np.ndarray, num_samples: int = 10000) -> Tuple
     Args:
         A: N×N matrix
         num_samples: Number of samples for Monte Carlo integration
+        chunk_size: Samples drawn per vectorised block
+        rng: Random generator
     
     Returns:
         (T_eta, error) where error = ||T_eta - I||_F
     """
-    N = A.shape[0]
-    
-    # Sample from cone measure (uniform on unit sphere)
-    samples = np.random.randn(num_samples, N)
-    samples /= np.linalg.norm(samples, axis=1, keepdims=True)
+    mc = isotropy_monte_carlo(A.shape[0], num_samples, chunk_size, rng)
+    return mc['T_eta'], mc['error']
+
+
+def trace_average_monte_carlo(Lambda_k_A: np.ndarray, num_samples: int = 10000, chunk_size: int = 100000,
+                              rng: np.random.Generator = None) -> Dict:
+    """
+    Chunked estimator of n_k ∫ ⟨(Λ^k A)w, w*⟩ dη(w) on the unit sphere of Λ^k space
     
-    # Compute T_η = ∫ w ⊗ w* dη
-    T_eta = np.zeros((N, N))
-    for w in samples:
-        T_eta += np.outer(w, w)
-    T_eta /= num_samples
+    The quadratic forms of a whole chunk are one einsum('ij,jk,ik->i'), and the
+    running sum / sum of squares give the standard error without storing samples.
     
-    # Check if T_eta ≈ I
-    I_N = np.eye(N)
-    error = np.linalg.norm(T_eta - I_N, 'fro')
+    Args:
+        Lambda_k_A: n_k×n_k exterior power
+        num_samples: Number of samples
+        chunk_size: Samples drawn per vectorised block
+        rng: Random generator (default: fresh np.random.default_rng())
     
-    return T_eta, error
+    Returns:
+        Dictionary with average, std_error and convergence [(n, average, std_error)] per chunk
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    n_k = Lambda_k_A.shape[0]
+    s1 = s2 = 0.0
+    n = 0
+    convergence = []
+    for w in _sphere_chunks(n_k, num_samples, chunk_size, rng):
+        q = n_k * np.einsum('ij,jk,ik->i', w, Lambda_k_A, w)
+        s1 += q.sum()
+        s2 += (q * q).sum()
+        n += len(w)
+        mean = s1 / n
+        se = np.sqrt(max(s2 / n - mean**2, 0.0) / max(n - 1, 1))
+        convergence.append((n, float(mean), float(se)))
+    
+    return {'average': convergence[-1][1], 'std_error': convergence[-1][2], 'convergence': convergence}
 
 
-def verify_trace_average_formula(A: np.ndarray, k: int, num_samples: int = 10000) -> Tuple[float, float, float]:
+def verify_trace_average_formula(A: np.ndarray, k: int, num_samples: int = 10000, chunk_size: int = 100000,
+                                 rng: np.random.Generator = None) -> Tuple[float, float, float]:
     """
     Verify: λ_k(A) = n_k ∫ ⟨(Λ^k A)w, w*⟩ dη(w)
     
@@ -157,6 +283,8 @@ def verify_trace_average_formula(A: np.ndarray, k: int, num_samples: int = 10000
         A: N×N matrix
         k: Order
         num_samples: Number of samples
+        chunk_size: Samples drawn per vectorised block
+        rng: Random generator
     
     Returns:
         (lambda_k_direct, lambda_k_average, error)
@@ -164,20 +292,8 @@ def verify_trace_average_formula(A: np.ndarray, k: int, num_samples: int = 10000
     # Direct computation
     lambda_k_direct = higher_trace(A, k)
     
-    # Trace average computation
-    N = A.shape[0]
-    n_k = int(comb(N, k))
-    Lambda_k_A = exterior_power(A, k)
-    
-    # Sample from unit sphere in Λ^k space
-    samples = np.random.randn(num_samples, n_k)
-    samples /= np.linalg.norm(samples, axis=1, keepdims=True)
-    
-    # Compute average: n_k ∫ ⟨(Λ^k A)w, w⟩ dη
-    average = 0.0
-    for w in samples:
-        average += np.dot(Lambda_k_A @ w, w)
-    average *= n_k / num_samples
+    # Trace average computation (needs the explicit Λ^k A)
+    average = trace_average_monte_carlo(exterior_power(A, k), num_samples, chunk_size, rng)['average']
     
     error = abs(lambda_k_direct - average)
     
@@ -1,9 +1,15 @@
 
-import json, math, random
+import json, math, random, argparse
 import numpy as np
+from scipy import stats
 
 ETA = np.diag([-1.0, 1.0, 1.0, 1.0])
 
+# Levi-Civita symbol ε_{ijk}
+EPS3 = np.zeros((3,3,3))
+EPS3[0,1,2] = EPS3[1,2,0] = EPS3[2,0,1] = 1.0
+EPS3[0,2,1] = EPS3[1,0,2] = EPS3[2,1,0] = -1.0
+
 def F_from_EB(E, B):
     F = np.zeros((4,4), dtype=float)
     for i in range(3):
@@ -56,7 +62,7 @@ def char_speeds(g):
     for _ in range(16):
         k = np.random.normal(size=3)
         nrm = np.linalg.norm(k)
-        if nrm == 0: 
+        if nrm == 0:
             continue
         k /= nrm
         gtt = g_up[0,0]
@@ -70,7 +76,7 @@ def char_speeds(g):
             return None, None
         sqrt_disc = math.sqrt(max(disc,0.0))
         if abs(A) < 1e-12:
-            if abs(B) < 1e-12: 
+            if abs(B) < 1e-12:
                 continue
             omega = -C/B
         else:
@@ -82,48 +88,161 @@ def char_speeds(g):
         return None, None
     return max(speeds), min(speeds)
 
-def scan(amax,bmax,cmax,emax,trials=300,tol=1e-6):
+# Batched versions: leading axis T over trials, same conventions as above
+
+def F_from_EB_batch(E, B):
+    # (T,3), (T,3) -> (T,4,4)
+    E = np.asarray(E, dtype=float); B = np.asarray(B, dtype=float)
+    F = np.zeros(E.shape[:-1] + (4,4))
+    F[..., 0, 1:] = E
+    F[..., 1:, 0] = -E
+    F[..., 1:, 1:] = -np.einsum('ijk,...k->...ij', EPS3, B)
+    return F
+
+def disformal_metric_batch(E, B, a, b, c, dphi=None):
+    # stack of disformal metrics for per-trial (a,b,c,E,B); dphi is (4,) or (T,4)
+    F = F_from_EB_batch(E, B)
+    Fup = ETA @ F @ ETA
+    I1 = np.sum(F*Fup, axis=(-2,-1))
+    T = (ETA @ F) @ np.swapaxes(F, -1, -2)
+    a, b, c = (np.asarray(v, dtype=float)[..., None, None] for v in (a, b, c))
+    g = ETA + a*I1[..., None, None]*ETA + b*T
+    if dphi is not None:
+        grad = np.broadcast_to(np.asarray(dphi, dtype=float), F.shape[:-1])
+        g = g + c*(grad[..., :, None]*grad[..., None, :])
+    return g
+
+def lorentzian_batch(g):
+    w = np.linalg.eigvalsh(g)
+    neg = np.sum(w < -1e-10, axis=-1)
+    pos = np.sum(w >  1e-10, axis=-1)
+    return (neg==1) & (pos>=3-(4-(neg+pos)))
+
+def random_directions(rng, T, n_dirs=16):
+    # (T, n_dirs, 3) unit vectors; zero draws are flagged invalid, as char_speeds skips them
+    k = rng.normal(size=(T, n_dirs, 3))
+    nrm = np.linalg.norm(k, axis=-1)
+    ok = nrm > 0
+    return k/np.where(ok, nrm, 1.0)[..., None], ok
+
+def char_speeds_batch(g, rng=None, n_dirs=16):
+    # vmax, vmin per trial over n_dirs random directions; NaN where char_speeds returns None
+    # (complex roots in any direction, or no usable direction)
+    rng = np.random.default_rng() if rng is None else rng
+    g_up = np.linalg.inv(g)
+    k, ok = random_directions(rng, g.shape[0], n_dirs)
+    A = g_up[:, 0, 0][:, None]
+    Bq = 2.0*np.einsum('ti,tdi->td', g_up[:, 0, 1:4], k)
+    C = np.einsum('tdi,tij,tdj->td', k, g_up[:, 1:4, 1:4], k)
+    disc = Bq*Bq - 4*A*C
+    complex_root = np.any((disc < 0) & ok, axis=1)
+    sqrt_disc = np.sqrt(np.maximum(disc, 0.0))
+    small_A = np.abs(A) < 1e-12
+    with np.errstate(divide='ignore', invalid='ignore'):
+        omega = np.where(small_A, -C/Bq,
+                         np.maximum(np.abs((-Bq + sqrt_disc)/(2*A)), np.abs((-Bq - sqrt_disc)/(2*A))))
+    use = ok & ~(small_A & (np.abs(Bq) < 1e-12))
+    speeds = np.abs(omega)
+    vmax = np.max(np.where(use, speeds, -np.inf), axis=1)
+    vmin = np.min(np.where(use, speeds, np.inf), axis=1)
+    bad = complex_root | ~use.any(axis=1)
+    return np.where(bad, np.nan, vmax), np.where(bad, np.nan, vmin)
+
+def pass_interval(passes, trials, level=0.95):
+    # Clopper-Pearson (exact binomial) interval for the pass fraction
+    alpha = 1.0 - level
+    lo = stats.beta.ppf(alpha/2, passes, trials - passes + 1) if passes > 0 else 0.0
+    hi = stats.beta.ppf(1 - alpha/2, passes + 1, trials - passes) if passes < trials else 1.0
+    return float(lo), float(hi)
+
+def scan_batch(amax,bmax,cmax,emax,trials=300,tol=1e-6,rng=None,chunk=1<<16,level=0.95):
+    # all trials as (chunk,4,4) metric stacks; pass fraction with a Clopper-Pearson interval
+    rng = np.random.default_rng() if rng is None else rng
     passes = 0
-    for _ in range(trials):
-        a = np.random.uniform(-amax,amax)
-        b = np.random.uniform(-bmax,bmax)
-        c = np.random.uniform(0,cmax)
-        E = np.random.uniform(-emax, emax, size=3)
-        B = np.random.uniform(-emax, emax, size=3)
-        g = disformal_metric(E,B,a,b,c)
-        if not lorentzian(g): 
-            continue
-        vmax, vmin = char_speeds(g)
-        if vmax is None: 
-            continue
-        if vmax <= 1.0 + tol and vmin >= 0.0 - tol:
-            passes += 1
-    return passes/trials
+    for start in range(0, trials, chunk):
+        m = min(chunk, trials - start)
+        a = rng.uniform(-amax, amax, m)
+        b = rng.uniform(-bmax, bmax, m)
+        c = rng.uniform(0, cmax, m)
+        E = rng.uniform(-emax, emax, size=(m,3))
+        B = rng.uniform(-emax, emax, size=(m,3))
+        g = disformal_metric_batch(E, B, a, b, c)
+        lor = lorentzian_batch(g)
+        vmax, vmin = char_speeds_batch(g[lor], rng)
+        passes += int(np.sum((vmax <= 1.0 + tol) & (vmin >= 0.0 - tol)))
+    lo, hi = pass_interval(passes, trials, level)
+    return {"passes": passes, "trials": trials, "pass_fraction": passes/trials,
+            "ci": [lo, hi], "level": level}
+
+def scan(amax,bmax,cmax,emax,trials=300,tol=1e-6,rng=None):
+    return scan_batch(amax,bmax,cmax,emax,trials,tol,rng)["pass_fraction"]
+
+def _region(scale, res):
+    return {"amax":scale,"bmax":scale,"cmax":scale,"emax":scale,"pass_fraction":res["pass_fraction"],
+            "ci":res["ci"],"trials":res["trials"]}
+
+def bisect_safe_scale(lo=0.005, hi=0.02, target=0.99, trials=600, tol=1e-6, rng=None,
+                      rel_tol=0.02, max_iter=20, conservative=False, level=0.95):
+    # largest common scale (a,b,c,E bounds) whose pass fraction meets target, by bisection in
+    # log-scale (pass fraction falls with scale); conservative=True requires the CI lower bound
+    rng = np.random.default_rng() if rng is None else rng
+    ok = lambda r: (r["ci"][0] if conservative else r["pass_fraction"]) >= target
+    history = []
+    def run(s):
+        r = scan_batch(s,s,s,s,trials,tol,rng,level=level)
+        history.append({"scale": s, **r})
+        return r
+    r_lo = run(lo)
+    if not ok(r_lo):
+        return {**_region(lo, r_lo), "found": False, "history": history}
+    r_hi = run(hi)
+    if ok(r_hi):
+        return {**_region(hi, r_hi), "found": True, "history": history}
+    for _ in range(max_iter):
+        if hi/lo - 1.0 <= rel_tol:
+            break
+        mid = math.sqrt(lo*hi)
+        r = run(mid)
+        if ok(r):
+            lo, r_lo = mid, r
+        else:
+            hi = mid
+    return {**_region(lo, r_lo), "found": True, "history": history}
 
-def find_safe_region():
+def find_safe_region(scales=(0.02, 0.015, 0.01, 0.0075, 0.005), trials=600, tol=1e-6, rng=None,
+                     adaptive=False, target=0.99):
     # coarse grid search to achieve ≥99% pass
     # shrink coefficients and fields together until criterion met
-    for scale in [0.02, 0.015, 0.01, 0.0075, 0.005]:
-        amax = bmax = cmax = scale
-        emax = scale
-        frac = scan(amax,bmax,cmax,emax,trials=600,tol=1e-6)
-        if frac >= 0.99:
-            return {"amax":amax,"bmax":bmax,"cmax":cmax,"emax":emax,"pass_fraction":frac}
-    # if not found, report best
+    if adaptive:
+        res = bisect_safe_scale(min(scales), max(scales), target, trials, tol, rng)
+        if res["found"]:
+            return {k: v for k, v in res.items() if k not in ("found", "history")}
+    results = []
+    for scale in scales:
+        res = scan_batch(scale,scale,scale,scale,trials=trials,tol=tol,rng=rng)
+        if res["pass_fraction"] >= target:
+            return _region(scale, res)
+        results.append((scale, res))
+    # if not found, report best (from the scans above)
     best = {"pass_fraction":0.0}
-    for scale in [0.02,0.015,0.01,0.0075,0.005]:
-        frac = scan(scale,scale,scale,scale,trials=600,tol=1e-6)
-        if frac > best.get("pass_fraction",0.0):
-            best = {"amax":scale,"bmax":scale,"cmax":scale,"emax":scale,"pass_fraction":frac}
+    for scale, res in results:
+        if res["pass_fraction"] > best.get("pass_fraction",0.0):
+            best = _region(scale, res)
     return best
 
 if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--trials", type=int, default=600)
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--adaptive", action="store_true", help="bisect the safe scale instead of the fixed list")
+    args = ap.parse_args()
+    rng = np.random.default_rng(args.seed)
     # Report two regimes and the discovered safe region (≥99% pass if found)
     regimes = {
-        "coarse_0p02": scan(0.02,0.02,0.02,0.02,trials=600),
-        "coarse_0p01": scan(0.01,0.01,0.01,0.01,trials=600)
+        "coarse_0p02": scan_batch(0.02,0.02,0.02,0.02,trials=args.trials,rng=rng),
+        "coarse_0p01": scan_batch(0.01,0.01,0.01,0.01,trials=args.trials,rng=rng)
     }
-    safe = find_safe_region()
+    safe = find_safe_region(trials=args.trials, rng=rng, adaptive=args.adaptive)
     out = {"regimes": regimes, "safe_region": safe}
     with open("artifacts/hyperbolicity_report.json","w") as f:
         json.dump(out, f, indent=2)
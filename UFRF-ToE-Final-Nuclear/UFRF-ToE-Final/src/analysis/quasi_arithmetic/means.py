@@ -31,42 +31,50 @@ Connections:
 
 import numpy as np
 from typing import Callable, List, Tuple, Optional
-from scipy import stats
-from scipy.optimize import minimize_scalar
+from numpy.typing import ArrayLike
+from scipy.special import gammaln, ndtr
+
+from .kde_bayes import kde_bayes_error
 
 # Generator functions for common quasi-arithmetic means
+#
+# All generators are array-aware (elementwise, scalars in -> floats out), so
+# a whole sample is transformed in one call.
+
+def _out(x, y):
+    """Return a float for scalar input, the array otherwise"""
+    return float(y) if np.ndim(x) == 0 else y
 
-def harmonic_generator(x: float) -> float:
+def harmonic_generator(x: ArrayLike) -> ArrayLike:
     """Generator for harmonic mean: f(x) = 1/x"""
-    if x == 0:
-        return np.inf
-    return 1.0 / x
+    x = np.asarray(x, dtype=float)
+    with np.errstate(divide='ignore'):
+        return _out(x, np.where(x == 0, np.inf, 1.0 / x))
 
-def harmonic_generator_inv(y: float) -> float:
+def harmonic_generator_inv(y: ArrayLike) -> ArrayLike:
     """Inverse generator for harmonic mean: f⁻¹(y) = 1/y"""
-    if y == 0:
-        return np.inf
-    return 1.0 / y
+    return harmonic_generator(y)
 
-def geometric_generator(x: float) -> float:
+def geometric_generator(x: ArrayLike) -> ArrayLike:
     """Generator for geometric mean: f(x) = log(x)"""
-    if x <= 0:
-        return -np.inf
-    return np.log(x)
+    x = np.asarray(x, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return _out(x, np.where(x <= 0, -np.inf, np.log(x)))
 
-def geometric_generator_inv(y: float) -> float:
+def geometric_generator_inv(y: ArrayLike) -> ArrayLike:
     """Inverse generator for geometric mean: f⁻¹(y) = exp(y)"""
-    return np.exp(y)
+    y = np.asarray(y, dtype=float)
+    return _out(y, np.exp(y))
 
-def arithmetic_generator(x: float) -> float:
+def arithmetic_generator(x: ArrayLike) -> ArrayLike:
     """Generator for arithmetic mean: f(x) = x"""
     return x
 
-def arithmetic_generator_inv(y: float) -> float:
+def arithmetic_generator_inv(y: ArrayLike) -> ArrayLike:
     """Inverse generator for arithmetic mean: f⁻¹(y) = y"""
     return y
 
-def phi_enhanced_generator(x: float, phi: float = (1 + np.sqrt(5))/2) -> float:
+def phi_enhanced_generator(x: ArrayLike, phi: float = (1 + np.sqrt(5))/2) -> ArrayLike:
     """
     Generator for φ-enhanced mean (UFRF REST)
     
@@ -74,33 +82,69 @@ def phi_enhanced_generator(x: float, phi: float = (1 + np.sqrt(5))/2) -> float:
     
     At REST: √φ enhancement appears
     """
-    if x <= 0:
-        return 0.0
-    return x**phi
+    x = np.asarray(x, dtype=float)
+    return _out(x, np.where(x <= 0, 0.0, np.maximum(x, 0.0)**phi))
 
-def phi_enhanced_generator_inv(y: float, phi: float = (1 + np.sqrt(5))/2) -> float:
+def phi_enhanced_generator_inv(y: ArrayLike, phi: float = (1 + np.sqrt(5))/2) -> ArrayLike:
     """Inverse: f⁻¹(y) = y^(1/φ)"""
-    if y <= 0:
-        return 0.0
-    return y**(1.0/phi)
+    y = np.asarray(y, dtype=float)
+    return _out(y, np.where(y <= 0, 0.0, np.maximum(y, 0.0)**(1.0/phi)))
 
-def factorial_generator(x: float) -> float:
+def factorial_generator(x: ArrayLike) -> ArrayLike:
     """
     Generator for factorial mean (triple series)
     
     f(x) = x / x! (factorial damping)
     
+    ⌊x⌋! = exp(gammaln(⌊x⌋ + 1)) for x ≤ 20; the Stirling form above.
+    
     Connects to topological closure
     """
-    import math
-    if x < 0:
-        return 0.0
-    # Use Stirling approximation for large x
-    if x > 20:
-        # log(x!) ≈ x*log(x) - x
-        return x * np.exp(-x * np.log(x) + x)
-    else:
-        return x / math.factorial(int(x))
+    x = np.asarray(x, dtype=float)
+    small = np.clip(x, 0.0, 20.0)
+    large = np.maximum(x, 20.0)
+    # Use Stirling approximation for large x: log(x!) ≈ x*log(x) - x
+    y = np.where(x > 20, large * np.exp(-large * np.log(large) + large),
+                 small * np.exp(-gammaln(np.floor(small) + 1.0)))
+    return _out(x, np.where(x < 0, 0.0, y))
+
+# Generator registry: name -> (f, f⁻¹), both elementwise over arrays
+
+GENERATORS = {
+    'harmonic': (harmonic_generator, harmonic_generator_inv),
+    'geometric': (geometric_generator, geometric_generator_inv),
+    'arithmetic': (arithmetic_generator, arithmetic_generator_inv),
+    'phi_enhanced': (phi_enhanced_generator, phi_enhanced_generator_inv),
+    'factorial': (factorial_generator, None),
+}
+_VECTORIZED = {f for pair in GENERATORS.values() for f in pair if f is not None}
+
+def register_generator(name: str, generator: Callable, generator_inv: Optional[Callable] = None,
+                       vectorized: bool = True) -> None:
+    """
+    Add a named generator pair to GENERATORS
+    
+    Args:
+        name: Registry key
+        generator, generator_inv: f and f⁻¹ (f⁻¹ may be None if only sums are needed)
+        vectorized: True if both accept arrays elementwise; otherwise they are
+                    wrapped with np.vectorize when applied
+    """
+    GENERATORS[name] = (generator, generator_inv)
+    if vectorized:
+        _VECTORIZED.update(f for f in (generator, generator_inv) if f is not None)
+
+def _resolve(generator) -> Tuple[Callable, Optional[Callable]]:
+    """(f, f⁻¹) from a registry name or an explicit pair"""
+    if isinstance(generator, str):
+        return GENERATORS[generator]
+    return tuple(generator)
+
+def _apply(f: Callable, x: np.ndarray) -> np.ndarray:
+    """Evaluate a generator elementwise (one call for registered generators)"""
+    if f in _VECTORIZED:
+        return np.asarray(f(x), dtype=float)
+    return np.vectorize(f, otypes=[float])(x)
 
 # Quasi-arithmetic mean computation
 
@@ -124,7 +168,7 @@ def quasi_arithmetic_mean(values: np.ndarray,
         return 0.0
     
     # Apply generator to all values
-    transformed = np.array([generator(x) for x in values])
+    transformed = _apply(generator, np.asarray(values, dtype=float))
     
     # Take arithmetic mean of transformed values
     mean_transformed = np.mean(transformed)
@@ -134,8 +178,73 @@ def quasi_arithmetic_mean(values: np.ndarray,
     
     return result
 
+def _segments(values, offsets: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Flat values and offsets (length P+1) from a list of arrays or a flat array + offsets"""
+    if offsets is None:
+        arrays = [np.asarray(v, dtype=float).ravel() for v in values]
+        offsets = np.concatenate([[0], np.cumsum([a.size for a in arrays])]).astype(np.int64)
+        flat = np.concatenate(arrays) if arrays else np.zeros(0)
+        return flat, offsets
+    return np.asarray(values, dtype=float).ravel(), np.asarray(offsets, dtype=np.int64)
+
+def transformed_sums(values, generator, offsets: Optional[np.ndarray] = None
+                     ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-segment sums Σf(x) and counts for ragged data
+    
+    Args:
+        values: List of arrays, or a flat array with `offsets`
+        generator: Registry name, (f, f⁻¹) pair, or f
+        offsets: Segment boundaries, values[offsets[i]:offsets[i+1]] is segment i
+    
+    Returns:
+        (sums, counts), each of shape (P,)
+    """
+    f = _resolve(generator)[0] if isinstance(generator, (str, tuple)) else generator
+    flat, offsets = _segments(values, offsets)
+    counts = np.diff(offsets)
+    seg = np.repeat(np.arange(counts.size), counts)
+    return np.bincount(seg, _apply(f, flat[offsets[0]:offsets[-1]]), counts.size), counts
+
+def quasi_arithmetic_means(values, generators='arithmetic',
+                           offsets: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    M_f for many (ragged) arrays and many generators in one call
+    
+    Args:
+        values: List of arrays, or a flat array with `offsets`
+        generators: Registry name or (f, f⁻¹) pair, or a list of them
+        offsets: Segment boundaries for flat input (length P+1)
+    
+    Returns:
+        (P,) means for a single generator, (G, P) for a list; 0.0 for empty segments
+    """
+    single = isinstance(generators, str) or (isinstance(generators, tuple) and callable(generators[0]))
+    gens = [generators] if single else list(generators)
+    flat, offsets = _segments(values, offsets)
+    out = np.zeros((len(gens), offsets.size - 1))
+    for k, g in enumerate(gens):
+        f, f_inv = _resolve(g)
+        sums, counts = transformed_sums(flat, f, offsets)
+        nz = counts > 0
+        if nz.any():
+            out[k, nz] = _apply(f_inv, sums[nz] / counts[nz])
+    return out[0] if single else out
+
 # Affinity measure
 
+def _affinity_from_sums(S_x, n_x, S_y, n_y, generator_inv: Callable) -> np.ndarray:
+    """
+    C_f(x,y) from cached transformed sums (broadcasts)
+    
+    M_f(x,y) and M_f(y,x) are both f⁻¹((Σf(x) + Σf(y)) / (n_x + n_y)), so the joint
+    mean is evaluated once and the ratio is 1 wherever it is finite and nonzero,
+    inf where it is 0 and NaN where it is not finite.
+    """
+    n = np.asarray(n_x) + np.asarray(n_y)
+    M_f = _apply(generator_inv, (np.asarray(S_x, dtype=float) + np.asarray(S_y, dtype=float)) / n)
+    return np.where(M_f == 0, np.inf, np.where(np.isfinite(M_f), 1.0, np.nan))
+
 def compute_affinity(x: np.ndarray, y: np.ndarray,
                     generator: Callable[[float], float],
                     generator_inv: Callable[[float], float]) -> float:
@@ -147,6 +256,11 @@ def compute_affinity(x: np.ndarray, y: np.ndarray,
     C_f ≈ 1: x and y are indistinguishable
     C_f >> 1 or C_f << 1: x and y are highly distinguishable
     
+    As defined here, M_f(x,y) and M_f(y,x) are means over the same multiset
+    (x and y concatenated in either order), so C_f is exactly 1 whenever the
+    joint mean is finite and nonzero (inf if it is 0, NaN if it is not finite);
+    this ratio cannot separate x from y.
+    
     Args:
         x, y: Arrays of values
         generator: Generator function
@@ -155,23 +269,110 @@ def compute_affinity(x: np.ndarray, y: np.ndarray,
     Returns:
         Affinity C_f
     """
-    # Forward mean: M_f(x,y)
-    combined_xy = np.concatenate([x, y])
-    M_f_xy = quasi_arithmetic_mean(combined_xy, generator, generator_inv)
+    # Transformed sums of each sample give the joint mean without concatenating
+    S, n = transformed_sums([x, y], generator)
+    return float(_affinity_from_sums(S[0], n[0], S[1], n[1], generator_inv))
+
+# Bayes error (emergence quantification)
+
+def gaussian_statistics(values: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-pattern sufficient statistics for the Gaussian Bayes-error kernel
+    
+    Args:
+        values: List of sample arrays (one per pattern)
     
-    # Reverse mean: M_f(y,x)
-    combined_yx = np.concatenate([y, x])
-    M_f_yx = quasi_arithmetic_mean(combined_yx, generator, generator_inv)
+    Returns:
+        (mu, sigma) arrays of shape (P,), population std as np.std
+    """
+    mu = np.array([np.mean(v) for v in values], dtype=float)
+    sigma = np.array([np.std(v) for v in values], dtype=float)
+    return mu, sigma
+
+def _relative_thresholds(d, sigma1, sigma2) -> Tuple[np.ndarray, np.ndarray]:
+    """Density intersections measured from μ₁, for μ₁ = 0 and μ₂ = d (see gaussian_decision_thresholds)"""
+    w1, w2 = 1.0 / sigma1**2, 1.0 / sigma2**2
+    a = w1 - w2
+    b = 2.0 * d * w2
+    c = -d**2 * w2 + 2.0 * np.log(sigma1 / sigma2)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        disc = np.sqrt(np.maximum(b * b - 4.0 * a * c, 0.0))
+        q = -0.5 * (b + np.where(b >= 0, disc, -disc))
+        r1 = np.where(a == 0, np.where(b > 0, -np.inf, np.inf), q / a)
+        r2 = c / q
+    
+    return np.minimum(r1, r2), np.maximum(r1, r2)
+
+def gaussian_decision_thresholds(mu1, sigma1, mu2, sigma2) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Intersections of the N(μ₁,σ₁²) and N(μ₂,σ₂²) densities (optimal decision thresholds)
     
-    # Affinity ratio
-    if M_f_yx == 0:
-        return np.inf
+    In coordinates t = x - μ₁ (so only d = μ₂ - μ₁ enters and large common offsets
+    cost no precision), log p₁ - log p₂ = -Q(t)/2 with Q(t) = a t² + b t + c,
+        a = 1/σ₁² - 1/σ₂²,  b = 2d/σ₂²,  c = -d²/σ₂² + 2 ln(σ₁/σ₂)
     
-    C_f = M_f_xy / M_f_yx
+    Roots use the cancellation-free form q = -(b + sign(b)√(b²-4ac))/2, roots q/a and c/q,
+    so equal widths (a = 0) give one finite threshold and one at ±∞. Broadcasts.
     
-    return C_f
+    Returns:
+        (lo, hi) sorted thresholds; NaN for identical distributions
+    """
+    mu1, sigma1, mu2, sigma2 = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (mu1, sigma1, mu2, sigma2)))
+    lo, hi = _relative_thresholds(mu2 - mu1, sigma1, sigma2)
+    return mu1 + lo, mu1 + hi
 
-# Bayes error (emergence quantification)
+def bayes_error_gaussian_batch(mu1, sigma1, mu2, sigma2) -> np.ndarray:
+    """
+    Vectorised Bayes error P_e = ½∫min(p₁, p₂) for broadcast Gaussian parameter arrays
+    
+    Between the two thresholds one density dominates; P_e is the mass of the smaller
+    density inside plus the other density's mass outside, all from one ndtr call.
+    Everything is evaluated relative to μ₁, so only μ₂ - μ₁ matters.
+    
+    Returns:
+        P_e ∈ [0, 0.5] with the broadcast shape
+    """
+    mu1, sigma1, mu2, sigma2 = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (mu1, sigma1, mu2, sigma2)))
+    d = mu2 - mu1
+    lo, hi = _relative_thresholds(d, sigma1, sigma2)
+    identical = (d == 0) & (sigma1 == sigma2)
+    
+    # Representative point strictly inside (lo, hi) to see which density dominates there
+    width = np.maximum(sigma1, sigma2)
+    mid = np.where(np.isinf(lo), hi - width, np.where(np.isinf(hi), lo + width, 0.5 * (lo + hi)))
+    Q = mid**2 / sigma1**2 - (mid - d)**2 / sigma2**2 + 2.0 * np.log(sigma1 / sigma2)
+    p1_inside = Q < 0  # p₁ > p₂ on (lo, hi)
+    
+    # z-scores of both thresholds under both densities, evaluated in a single ndtr call
+    z = np.stack([lo / sigma1, hi / sigma1, (lo - d) / sigma2, (hi - d) / sigma2])
+    Phi = ndtr(np.concatenate([z, -z]))
+    lo1, hi1, lo2, hi2, clo1, chi1, clo2, chi2 = Phi
+    
+    # Mass inside (lo, hi), taken from the upper tails when the interval lies right of the mean
+    inside1 = np.where(z[0] > 0, clo1 - chi1, hi1 - lo1)
+    inside2 = np.where(z[2] > 0, clo2 - chi2, hi2 - lo2)
+    outside1 = lo1 + chi1
+    outside2 = lo2 + chi2
+    
+    P_e = 0.5 * np.where(p1_inside, inside2 + outside1, inside1 + outside2)
+    return np.where(identical, 0.5, np.clip(P_e, 0.0, 0.5))
+
+def bayes_error_matrix(mu: np.ndarray, sigma: np.ndarray) -> np.ndarray:
+    """
+    Full P×P matrix of pairwise Gaussian Bayes errors (diagonal 0.5)
+    
+    Args:
+        mu, sigma: Per-pattern statistics (see gaussian_statistics); extra leading
+                   axes (e.g. parameter points) broadcast, the last axis is the pattern axis
+    
+    Returns:
+        (..., P, P) symmetric matrix
+    """
+    mu = np.asarray(mu, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+    return bayes_error_gaussian_batch(mu[..., :, None], sigma[..., :, None],
+                                      mu[..., None, :], sigma[..., None, :])
 
 def bayes_error_gaussian(mu1: float, sigma1: float, 
                         mu2: float, sigma2: float) -> float:
@@ -179,6 +380,7 @@ def bayes_error_gaussian(mu1: float, sigma1: float,
     Compute Bayes error P_e for two Gaussian distributions
     
     P_e = probability of misclassifying samples from N(μ₁,σ₁²) vs N(μ₂,σ₂²)
+    (equal priors, optimal decision regions bounded by the density intersections)
     
     When P_e → 0: Distributions are distinguishable (emergence)
     When P_e → 0.5: Distributions are indistinguishable (no emergence)
@@ -190,32 +392,21 @@ def bayes_error_gaussian(mu1: float, sigma1: float,
     Returns:
         Bayes error P_e ∈ [0, 0.5]
     """
-    # Find optimal decision boundary (minimizes error)
-    def error_at_threshold(t):
-        # P(error) = P(X₁ > t) + P(X₂ < t)
-        p_error_1 = 1 - stats.norm.cdf(t, mu1, sigma1)
-        p_error_2 = stats.norm.cdf(t, mu2, sigma2)
-        return 0.5 * (p_error_1 + p_error_2)
-    
-    # Find threshold that minimizes error
-    result = minimize_scalar(error_at_threshold, 
-                            bounds=(min(mu1, mu2) - 5*max(sigma1, sigma2),
-                                   max(mu1, mu2) + 5*max(sigma1, sigma2)),
-                            method='bounded')
-    
-    P_e = result.fun
-    
-    return P_e
+    return float(bayes_error_gaussian_batch(mu1, sigma1, mu2, sigma2))
 
 def bayes_error_from_samples(samples1: np.ndarray, 
                             samples2: np.ndarray,
-                            assume_gaussian: bool = True) -> float:
+                            assume_gaussian: bool = True,
+                            bins: int = 2048,
+                            bandwidth='silverman') -> float:
     """
     Estimate Bayes error from sample data
     
     Args:
         samples1, samples2: Sample arrays from two distributions
         assume_gaussian: If True, fit Gaussians; else use KDE
+        bins: KDE grid points (assume_gaussian=False)
+        bandwidth: KDE bandwidth rule ('silverman', 'scott') or width
     
     Returns:
         Estimated Bayes error P_e
@@ -227,9 +418,8 @@ def bayes_error_from_samples(samples1: np.ndarray,
         
         return bayes_error_gaussian(mu1, sigma1, mu2, sigma2)
     else:
-        # Use kernel density estimation
-        # (More complex, not implemented here)
-        raise NotImplementedError("KDE-based Bayes error not yet implemented")
+        # Kernel density estimates binned on a shared grid (see kde_bayes)
+        return kde_bayes_error(samples1, samples2, bins=bins, bandwidth=bandwidth)
 
 # Emergence threshold
 
@@ -247,18 +437,14 @@ def emergence_threshold(values: List[np.ndarray],
         threshold_pe: P_e threshold for emergence (default 0.1)
     
     Returns:
-        Dictionary with emergence analysis
+        Dictionary with emergence analysis; 'affinities' lists C_f for each pair
+        i < j, which is all ones for finite nonzero means (see compute_affinity)
     """
     n_patterns = len(values)
     
-    # Compute pairwise Bayes errors
-    pairwise_errors = np.zeros((n_patterns, n_patterns))
-    
-    for i in range(n_patterns):
-        for j in range(i+1, n_patterns):
-            P_e = bayes_error_from_samples(values[i], values[j])
-            pairwise_errors[i, j] = P_e
-            pairwise_errors[j, i] = P_e
+    # Compute pairwise Bayes errors (statistics once per pattern, one batched kernel call)
+    pairwise_errors = bayes_error_matrix(*gaussian_statistics(values))
+    np.fill_diagonal(pairwise_errors, 0.0)
     
     # Average Bayes error
     avg_pe = np.mean(pairwise_errors[np.triu_indices(n_patterns, k=1)])
@@ -266,12 +452,10 @@ def emergence_threshold(values: List[np.ndarray],
     # Emergence status
     emerged = avg_pe < threshold_pe
     
-    # Compute affinities
-    affinities = []
-    for i in range(n_patterns):
-        for j in range(i+1, n_patterns):
-            C_f = compute_affinity(values[i], values[j], generator, generator_inv)
-            affinities.append(C_f)
+    # Compute affinities from per-pattern transformed sums
+    S, n = transformed_sums(values, generator)
+    i, j = np.triu_indices(n_patterns, k=1)
+    affinities = _affinity_from_sums(S[i], n[i], S[j], n[j], generator_inv).tolist()
     
     return {
         'emerged': emerged,
@@ -285,7 +469,8 @@ def emergence_threshold(values: List[np.ndarray],
 # UFRF-specific applications
 
 def nuclear_gap_emergence(gap_energies: np.ndarray, 
-                         background_energies: np.ndarray) -> dict:
+                         background_energies: np.ndarray,
+                         assume_gaussian: bool = True) -> dict:
     """
     Quantify emergence of nuclear gaps using harmonic mean
     
@@ -294,12 +479,13 @@ def nuclear_gap_emergence(gap_energies: np.ndarray,
     Args:
         gap_energies: Energies at gap positions
         background_energies: Energies away from gaps
+        assume_gaussian: Gaussian P_e if True, else KDE estimate
     
     Returns:
         Emergence analysis with P_e
     """
     # Use harmonic mean (appropriate for nuclear binding)
-    P_e = bayes_error_from_samples(gap_energies, background_energies)
+    P_e = bayes_error_from_samples(gap_energies, background_energies, assume_gaussian)
     
     C_f = compute_affinity(gap_energies, background_energies,
                           harmonic_generator, harmonic_generator_inv)
@@ -314,7 +500,8 @@ def nuclear_gap_emergence(gap_energies: np.ndarray,
     }
 
 def ppn_bound_emergence(ufrf_metric: np.ndarray,
-                       gr_metric: np.ndarray) -> dict:
+                       gr_metric: np.ndarray,
+                       assume_gaussian: bool = True) -> dict:
     """
     Quantify GR recovery using geometric mean
     
@@ -323,6 +510,7 @@ def ppn_bound_emergence(ufrf_metric: np.ndarray,
     Args:
         ufrf_metric: UFRF metric components
         gr_metric: GR metric components
+        assume_gaussian: Gaussian P_e if True, else KDE estimate
     
     Returns:
         Emergence analysis with C_f
@@ -331,7 +519,7 @@ def ppn_bound_emergence(ufrf_metric: np.ndarray,
     C_f = compute_affinity(ufrf_metric, gr_metric,
                           geometric_generator, geometric_generator_inv)
     
-    P_e = bayes_error_from_samples(ufrf_metric, gr_metric)
+    P_e = bayes_error_from_samples(ufrf_metric, gr_metric, assume_gaussian)
     
     return {
         'affinity': C_f,
@@ -343,7 +531,8 @@ def ppn_bound_emergence(ufrf_metric: np.ndarray,
     }
 
 def rest_closure_emergence(rest_config: np.ndarray,
-                          non_rest_config: np.ndarray) -> dict:
+                          non_rest_config: np.ndarray,
+                          assume_gaussian: bool = True) -> dict:
     """
     Quantify REST closure using φ-enhanced mean
     
@@ -352,6 +541,7 @@ def rest_closure_emergence(rest_config: np.ndarray,
     Args:
         rest_config: Field configuration at REST
         non_rest_config: Field configuration away from REST
+        assume_gaussian: Gaussian P_e if True, else KDE estimate
     
     Returns:
         Emergence analysis
@@ -359,7 +549,7 @@ def rest_closure_emergence(rest_config: np.ndarray,
     # Use φ-enhanced mean (REST has √φ enhancement)
     phi = (1 + np.sqrt(5)) / 2
     
-    P_e = bayes_error_from_samples(rest_config, non_rest_config)
+    P_e = bayes_error_from_samples(rest_config, non_rest_config, assume_gaussian)
     
     C_f = compute_affinity(rest_config, non_rest_config,
                           phi_enhanced_generator, phi_enhanced_generator_inv)
@@ -38,114 +38,151 @@ This explains why triple series S ≈ 0.0016 (not exactly 0):
 It's the systematic projection term for observing the concurrent
 trinity from our scale M = 144,000. Perfect zero would violate
 the projection law (would imply no scale separation).
+
+Array API:
+project_observations broadcasts (true_value, source_scale, S, noise_std)
+arrays against each other, draws ε from the instance's np.random.Generator
+(pass rng=np.random.default_rng(seed) for reproducible campaigns) and returns
+columnar results (a dict of equally shaped arrays). The scalar methods are
+thin wrappers and also accept arrays.
 """
 
 import numpy as np
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union
 import math
 
+ArrayLike = Union[float, np.ndarray]
+
 class ProjectionLaw:
     """
     UFRF Projection Law for cross-scale observation
     """
     
-    def __init__(self, observer_scale: float = 144000):
+    def __init__(self, observer_scale: float = 144000, rng: Optional[np.random.Generator] = None):
         """
         Initialize projection law
         
         Args:
             observer_scale: Observer scale M (default 144,000 = 144×10³)
+            rng: Noise generator (default: fresh np.random.default_rng())
         """
         self.M_observer = observer_scale
         self.alpha = 1.0 / 137.036  # Fine structure constant
         self.base_scale = 144  # Base scale for nesting
+        self.rng = np.random.default_rng() if rng is None else rng
         
-    def scale_separation(self, source_scale: float) -> float:
+    def scale_separation(self, source_scale: ArrayLike) -> ArrayLike:
         """
         Compute scale separation d_M
         
         d_M = |log(M_observer / M_source)|
         
         Args:
-            source_scale: Scale of source phenomenon
+            source_scale: Scale of source phenomenon (scalar or array)
         
         Returns:
-            Scale separation d_M
+            Scale separation d_M (0 where a scale is non-positive)
         """
-        if source_scale <= 0 or self.M_observer <= 0:
-            return 0.0
+        source_scale = np.asarray(source_scale, dtype=float)
+        valid = (source_scale > 0) & (self.M_observer > 0)
         
-        ratio = self.M_observer / source_scale
-        d_M = abs(np.log(ratio))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            d_M = np.where(valid, np.abs(np.log(self.M_observer / source_scale)), 0.0)
         
-        return d_M
+        return float(d_M) if d_M.ndim == 0 else d_M
     
-    def nested_scale(self, n: int) -> float:
+    def nested_scale(self, n: ArrayLike) -> ArrayLike:
         """
         Compute nested scale M_n = 144×10^n
         
         Args:
-            n: Scale index (can be negative)
+            n: Scale index (can be negative; scalar or array)
         
         Returns:
             Scale M_n
         """
-        return self.base_scale * (10 ** n)
+        if np.ndim(n) == 0:
+            return self.base_scale * (10 ** n)
+        return self.base_scale * 10.0 ** np.asarray(n)
     
-    def project_observation(self, 
-                          true_value: float,
-                          source_scale: float,
-                          systematic_term: float,
-                          noise_std: float = 1e-3) -> Tuple[float, dict]:
+    def project_observations(self,
+                             true_value: ArrayLike,
+                             source_scale: ArrayLike,
+                             systematic_term: ArrayLike,
+                             noise_std: ArrayLike = 1e-3,
+                             rng: Optional[np.random.Generator] = None) -> dict:
         """
-        Apply projection law to compute observed value
+        Apply projection law to broadcast arrays of observations
         
         ln O = ln O* + d_M · α · S + ε
         
         Args:
-            true_value: True value O* at source scale
-            source_scale: Scale of source
+            true_value: True values O* at source scale
+            source_scale: Scales of source
             systematic_term: Systematic projection S
             noise_std: Standard deviation of noise ε
+            rng: Noise generator (default: self.rng)
         
         Returns:
-            (observed_value, details_dict)
+            Dictionary of columns, each of the broadcast shape (same keys as
+            the project_observation details)
         """
-        if true_value <= 0:
+        true_value, source_scale, systematic_term, noise_std = np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in (true_value, source_scale, systematic_term, noise_std)))
+        if np.any(true_value <= 0):
             raise ValueError("True value must be positive for log projection")
+        rng = self.rng if rng is None else rng
         
-        # Compute scale separation
-        d_M = self.scale_separation(source_scale)
-        
-        # Generate random noise
-        epsilon = np.random.normal(0, noise_std)
+        # Scale separation, noise and projection law, all elementwise
+        d_M = np.asarray(self.scale_separation(source_scale))
+        epsilon = rng.normal(0.0, noise_std)
+        systematic_contribution = d_M * self.alpha * systematic_term
         
-        # Apply projection law
         ln_O_star = np.log(true_value)
-        ln_O = ln_O_star + d_M * self.alpha * systematic_term + epsilon
-        
+        ln_O = ln_O_star + systematic_contribution + epsilon
         observed_value = np.exp(ln_O)
         
-        # Compute contributions
-        systematic_contribution = d_M * self.alpha * systematic_term
-        
-        details = {
+        return {
             'true_value': true_value,
             'observed_value': observed_value,
             'source_scale': source_scale,
-            'observer_scale': self.M_observer,
+            'observer_scale': np.full(true_value.shape, float(self.M_observer)),
             'scale_separation': d_M,
             'systematic_term': systematic_term,
             'systematic_contribution': systematic_contribution,
             'noise': epsilon,
             'total_distortion': ln_O - ln_O_star,
-            'relative_error': abs(observed_value - true_value) / true_value
+            'relative_error': np.abs(observed_value - true_value) / true_value
         }
+    
+    def project_observation(self, 
+                          true_value: ArrayLike,
+                          source_scale: ArrayLike,
+                          systematic_term: ArrayLike,
+                          noise_std: ArrayLike = 1e-3) -> Tuple[ArrayLike, dict]:
+        """
+        Apply projection law to compute observed value
+        
+        ln O = ln O* + d_M · α · S + ε
+        
+        Args:
+            true_value: True value O* at source scale
+            source_scale: Scale of source
+            systematic_term: Systematic projection S
+            noise_std: Standard deviation of noise ε
+        
+        Returns:
+            (observed_value, details_dict); floats for scalar inputs, columns otherwise
+        """
+        details = self.project_observations(true_value, source_scale, systematic_term, noise_std)
+        
+        if details['observed_value'].ndim == 0:
+            details = {key: float(value) for key, value in details.items()}
         
-        return observed_value, details
+        return details['observed_value'], details
     
-    def rest_projection(self, true_value: float, 
-                       systematic_term: float = 0.0016) -> Tuple[float, dict]:
+    def rest_projection(self, true_value: ArrayLike, 
+                       systematic_term: ArrayLike = 0.0016) -> Tuple[ArrayLike, dict]:
         """
         Project observation at REST (same scale, d_M → 0)
         
@@ -156,7 +193,7 @@ class ProjectionLaw:
         - Only noise ε remains
         
         Args:
-            true_value: True value at REST
+            true_value: True value at REST (scalar or array)
             systematic_term: S (should be small at REST)
         
         Returns:
@@ -168,9 +205,9 @@ class ProjectionLaw:
                                        systematic_term,
                                        noise_std=1e-4)  # Reduced noise at REST
     
-    def cross_scale_projection(self, true_value: float,
-                              scale_index_source: int,
-                              systematic_term: float = 0.0016) -> Tuple[float, dict]:
+    def cross_scale_projection(self, true_value: ArrayLike,
+                              scale_index_source: ArrayLike,
+                              systematic_term: ArrayLike = 0.0016) -> Tuple[ArrayLike, dict]:
         """
         Project observation across nested scales
         
@@ -178,8 +215,8 @@ class ProjectionLaw:
         Source at M' = 144×10^n
         
         Args:
-            true_value: True value at source scale
-            scale_index_source: n for M' = 144×10^n
+            true_value: True value at source scale (scalar or array)
+            scale_index_source: n for M' = 144×10^n (broadcast against true_value)
             systematic_term: S for this observation
         
         Returns:
@@ -191,8 +228,8 @@ class ProjectionLaw:
                                        source_scale,
                                        systematic_term)
     
-    def triple_series_projection(self, true_value: float,
-                                source_scale: float) -> Tuple[float, dict]:
+    def triple_series_projection(self, true_value: ArrayLike,
+                                source_scale: ArrayLike) -> Tuple[ArrayLike, dict]:
         """
         Project using triple series systematic term
         
@@ -21,10 +21,12 @@ Hopf Fibration:
 """
 
 import numpy as np
-import math
+from fractions import Fraction
 from typing import Tuple, Optional
 from dataclasses import dataclass
 
+from .triple_series import inverse_factorial_table, power_table, reciprocal_table, shell_sums
+
 @dataclass
 class FieldConfiguration:
     """
@@ -289,7 +291,7 @@ class UFRFManifold:
         return summary
 
 
-def triple_series_as_closure() -> float:
+def triple_series_as_closure(max_terms: int = 20, precision: str = "float") -> float:
     """
     Compute triple series S_{a,b,c} as topological closure measure
     
@@ -299,30 +301,27 @@ def triple_series_as_closure() -> float:
     For (a,b,c) = (2,2,2) (degree-2, octave), S = 0 exactly.
     This corresponds to topological closure: χ(M) = 0 for S³.
     
+    The sum factorises into per-index tables (-1)^m/m!, (-2)^n/n!, (-1/2)^p/p!
+    convolved over total-order shells (see triple_series.shell_sums); use
+    precision="exact" or "mpmath" to check the cancellation without rounding.
+    
+    Args:
+        max_terms: Indices run over 0..max_terms-1 (convergence is fast due to factorial)
+        precision: "float", "exact" (Fraction) or "mpmath"
+    
     Returns:
         S_{2,2,2} (should be ≈ 0 for closure)
     """
-    # Compute triple series with degree-2 octave structure
-    S = 0.0
-    max_terms = 20  # Convergence is fast due to factorial
-    
-    for m in range(max_terms):
-        for n in range(max_terms):
-            for p in range(max_terms):
-                if m == 0 and n == 0 and p == 0:
-                    continue
-                
-                sign = (-1)**(m + n + p)
-                factorial_term = 1.0 / (math.factorial(m) * 
-                                       math.factorial(n) * 
-                                       math.factorial(p))
-                octave_term = 2**(n - p)
-                denominator = m + n + p + 1
-                
-                term = sign * factorial_term * octave_term / denominator
-                S += term
+    K = max_terms - 1
+    inv_fact = inverse_factorial_table(K, precision)
+    shells = shell_sums(inv_fact * power_table(-1, K, precision),
+                        inv_fact * power_table(-2, K, precision),
+                        inv_fact * power_table(Fraction(-1, 2), K, precision))
+    denominator = reciprocal_table(3 * K, precision)
     
-    return S
+    # Skip the m = n = p = 0 term (the whole s = 0 shell)
+    S = (shells * denominator)[1:].sum()
+    return float(S) if precision == "float" else S
 
 
 if __name__ == "__main__":
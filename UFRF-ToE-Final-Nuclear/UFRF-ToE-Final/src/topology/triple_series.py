@@ -31,12 +31,255 @@ The small non-zero value represents the irreducible projection noise ε
 in the projection law: ln O = ln O* + d_M · α · S + ε
 
 At REST: S→0 but ε≠0 (quantum/thermal fluctuations remain)
+
+Evaluation:
+Every factor except (m+n+p)! depends on a single index, so each total-order
+shell Σ_{m+n+p=s} is a triple convolution of per-index tables
+(m^a·(-1/3)^m, n^b·(-2)^n, p^c·(-1/2)^p) weighted by 1/s!. All shells, and
+hence every truncation order, come out of one batched pass; precision
+"exact" (Fraction) and "mpmath" run the same convolutions on object arrays.
 """
 
 import numpy as np
 import math
+from fractions import Fraction
+from functools import lru_cache
 from typing import Tuple
 
+PRECISIONS = ("float", "exact", "mpmath")
+
+
+def _convert(values, precision: str) -> np.ndarray:
+    """Cast a list of Fractions to float64 or an object array of Fraction / mpmath.mpf"""
+    if precision == "float":
+        return np.array([float(v) for v in values])
+    if precision == "exact":
+        return np.array(values, dtype=object)
+    if precision == "mpmath":
+        import mpmath
+        return np.array([mpmath.mpf(v.numerator) / v.denominator for v in values], dtype=object)
+    raise ValueError(f"unknown precision {precision!r}; expected one of {PRECISIONS}")
+
+
+def log_factorial(n_max: int) -> np.ndarray:
+    """log k! for k = 0..n_max"""
+    return np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, n_max + 1)))))
+
+
+def inverse_factorial_table(n_max: int, precision: str = "float") -> np.ndarray:
+    """1/k! for k = 0..n_max (from log_factorial in float mode)"""
+    if precision == "float":
+        return np.exp(-log_factorial(n_max))
+    return _convert([Fraction(1, math.factorial(k)) for k in range(n_max + 1)], precision)
+
+
+def reciprocal_table(n_max: int, precision: str = "float") -> np.ndarray:
+    """1/(k+1) for k = 0..n_max"""
+    return _convert([Fraction(1, k + 1) for k in range(n_max + 1)], precision)
+
+
+def power_table(base: Fraction, max_index: int, precision: str = "float") -> np.ndarray:
+    """base^k for k = 0..max_index; sign masks are folded in as negative bases"""
+    base = Fraction(base)
+    return _convert([base**k for k in range(max_index + 1)], precision)
+
+
+def monomial_table(degrees, max_index: int, precision: str = "float") -> np.ndarray:
+    """k^d for k = 0..max_index and every degree d, shape (len(degrees), max_index+1); 0^0 = 1"""
+    degrees = np.atleast_1d(degrees)
+    if precision == "float":
+        return np.power(np.arange(max_index + 1, dtype=float)[None, :], degrees[:, None])
+    return np.array([_convert([Fraction(k**int(d)) for k in range(max_index + 1)], precision)
+                     for d in degrees], dtype=object)
+
+
+def _shell_matrix(len_a: int, len_b: int) -> np.ndarray:
+    """One-hot (len_a·len_b, len_a+len_b-1) matrix sending the pair (i, j) to shell i+j"""
+    i, j = np.divmod(np.arange(len_a * len_b), len_b)
+    A = np.zeros((len_a * len_b, len_a + len_b - 1))
+    A[np.arange(len_a * len_b), i + j] = 1.0
+    return A
+
+
+def _convolve(x: np.ndarray, y: np.ndarray, chunk: int) -> np.ndarray:
+    """Row-wise full convolution of (T, a) and (T, b) tables"""
+    if x.dtype == object or y.dtype == object:
+        return np.array([np.convolve(xr, yr) for xr, yr in zip(x, y)], dtype=object)
+    A = _shell_matrix(x.shape[1], y.shape[1])
+    out = np.empty((x.shape[0], A.shape[1]))
+    for i in range(0, x.shape[0], chunk):
+        xs, ys = x[i:i + chunk], y[i:i + chunk]
+        out[i:i + chunk] = (xs[:, :, None] * ys[:, None, :]).reshape(len(xs), -1) @ A
+    return out
+
+
+def shell_sums(G: np.ndarray, H: np.ndarray, P: np.ndarray, chunk: int = 2048) -> np.ndarray:
+    """
+    Σ_{m+n+p=s} G[m]·H[n]·P[p] for every shell s = 0..3K
+    
+    Args:
+        G, H, P: (K+1,) or batched (T, K+1) per-index tables
+        chunk: Rows per vectorised block in float mode
+    
+    Returns:
+        (3K+1,) or (T, 3K+1) shell sums
+    """
+    single = np.ndim(G) == 1
+    G, H, P = (np.atleast_2d(t) for t in (G, H, P))
+    out = _convolve(_convolve(G, H, chunk), P, chunk)
+    return out[0] if single else out
+
+
+def series_shells(degrees=(1, 2, 3), max_terms: int = 30, precision: str = "float") -> np.ndarray:
+    """
+    Total-order shells of S_{a,b,c} over the cube 0 ≤ m,n,p ≤ max_terms
+    
+    shells[s] = Σ_{m+n+p=s} m^a·n^b·p^c·(-1)^(m+n+p)·2^(n-p) / (s!·3^m)
+    
+    The m=n=p=0 term is excluded (shells[0] = 0), as in the term-by-term sums.
+    Shells s ≤ max_terms are complete, so cumsum(shells)[s] is the sum truncated
+    at total order s; the sum of all shells is the full cube sum.
+    
+    Args:
+        degrees: (a,b,c) or an array of shape (T, 3) for a batched sweep
+        max_terms: Maximum value for each index
+        precision: "float", "exact" (Fraction) or "mpmath" (current mp.dps)
+    
+    Returns:
+        (3·max_terms+1,) or (T, 3·max_terms+1) shell contributions
+    """
+    degrees = np.asarray(degrees, dtype=int)
+    single = degrees.ndim == 1
+    a, b, c = np.atleast_2d(degrees).T
+    K = max_terms
+    G = monomial_table(a, K, precision) * power_table(Fraction(-1, 3), K, precision)
+    H = monomial_table(b, K, precision) * power_table(-2, K, precision)
+    P = monomial_table(c, K, precision) * power_table(Fraction(-1, 2), K, precision)
+    shells = shell_sums(G, H, P) * inverse_factorial_table(3 * K, precision)
+    shells[..., 0] = 0
+    return shells[0] if single else shells
+
+
+def compute_degree_series_batch(degrees, max_terms: int = 30, precision: str = "float") -> np.ndarray:
+    """
+    S_{a,b,c} for many (a,b,c) triples in one batched call
+    
+    Args:
+        degrees: Array of shape (T, 3)
+        max_terms: Maximum index value
+        precision: "float", "exact" or "mpmath"
+    
+    Returns:
+        (T,) series sums (object dtype outside float mode)
+    """
+    return series_shells(np.atleast_2d(degrees), max_terms, precision).sum(axis=1)
+
+@lru_cache(maxsize=8)
+def base_term_tensor(max_terms: int) -> np.ndarray:
+    """
+    B[m,n,p] = (-1)^(m+n+p)·2^(n-p) / ((m+n+p)!·3^m) on the cube 0..max_terms, B[0,0,0] = 0
+    
+    Shared by every (a,b,c) in a degree scan; cached per max_terms (read-only).
+    """
+    k = np.arange(max_terms + 1)
+    m, n, p = np.meshgrid(k, k, k, indexing='ij')
+    log_mag = (n - p) * np.log(2.0) - m * np.log(3.0) - log_factorial(3 * max_terms)[m + n + p]
+    B = np.where((m + n + p) % 2, -1.0, 1.0) * np.exp(log_mag)
+    B[0, 0, 0] = 0.0
+    B.flags.writeable = False
+    return B
+
+
+def _log_weights(exponents: np.ndarray, max_terms: int) -> np.ndarray:
+    """exp(e·log k) for k = 0..max_terms, shape (T, max_terms+1), with 0^0 = 1"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        W = np.exp(np.outer(exponents, np.log(np.arange(max_terms + 1, dtype=float))))
+    W[:, 0] = exponents == 0
+    return W
+
+
+def _shell_tail_bound(d: np.ndarray, s_min: int, ratio: float = 2.0 + 1.0 / 3.0 + 0.5) -> np.ndarray:
+    """
+    Σ_{s≥s_min} s^d·r^s/s!, which bounds Σ |terms| over all shells s ≥ s_min
+    
+    On a shell, Σ_{m+n+p=s} m^a n^b p^c 3^-m 2^n 2^-p ≤ s^(a+b+c)·(1/3 + 2 + 1/2)^s.
+    The sum is explicit over a 64-shell window and closed with the geometric
+    remainder (the term ratio is non-increasing past the window).
+    """
+    s_max = s_min + 63
+    s = np.arange(s_min, s_max + 1, dtype=float)
+    log_terms = d[:, None] * np.log(s)[None, :] + s * np.log(ratio) - log_factorial(s_max)[s_min:]
+    q = ratio * (1.0 + 1.0 / s_max)**d / (s_max + 1)
+    if np.any(q >= 0.5):
+        raise ValueError("degrees too large for the tail window")
+    return np.exp(log_terms).sum(axis=1) + np.exp(log_terms[:, -1]) * q / (1.0 - q)
+
+
+def truncation_error_bound(degrees, max_terms: int, chunk: int = 4096) -> np.ndarray:
+    """
+    Upper bound on |S_{a,b,c} - S_{a,b,c}^{(K)}| for the cube truncation K = max_terms
+    
+    The omitted terms are summed in absolute value over the shell between the
+    cube K and an extended cube K' = 2K+16 (the same contraction as
+    scan_degree_grid, against |B| with the inner cube zeroed); everything
+    beyond K' has total order > K' and is covered by _shell_tail_bound.
+    
+    Args:
+        degrees: Array of shape (T, 3) with non-negative entries
+        max_terms: Cube truncation
+        chunk: Triples per vectorised block
+    
+    Returns:
+        (T,) error bounds
+    """
+    degrees = np.atleast_2d(np.asarray(degrees, dtype=float))
+    K_ext = 2 * max_terms + 16
+    A = np.abs(base_term_tensor(K_ext))
+    A[:max_terms + 1, :max_terms + 1, :max_terms + 1] = 0.0
+    return _contract(A, degrees, chunk) + _shell_tail_bound(degrees.sum(axis=1), K_ext + 1)
+
+
+def _contract(B: np.ndarray, degrees: np.ndarray, chunk: int) -> np.ndarray:
+    """Σ B[m,n,p]·m^a n^b p^c for every row (a,b,c) of degrees"""
+    K1 = B.shape[0]
+    B = B.reshape(K1, K1 * K1)
+    out = np.empty(len(degrees))
+    for i in range(0, len(degrees), chunk):
+        a, b, c = degrees[i:i + chunk].T
+        X = (_log_weights(a, K1 - 1) @ B).reshape(-1, K1, K1)
+        out[i:i + chunk] = np.einsum('tnp,tn,tp->t', X, _log_weights(b, K1 - 1), _log_weights(c, K1 - 1))
+    return out
+
+
+def scan_degree_grid(degrees, max_terms: int = 30, chunk: int = 4096) -> dict:
+    """
+    S_{a,b,c} over an array of (a,b,c) exponents sharing one base term tensor
+    
+    S_t = Σ B[m,n,p]·exp(a_t log m)·exp(b_t log n)·exp(c_t log p): the m contraction
+    is a single (T, K+1) @ (K+1, (K+1)²) matrix product against base_term_tensor,
+    and the n, p weights are applied as a batched contraction. Exponents may be
+    real; they must be non-negative (the m=0 plane needs 0^a to be finite).
+    
+    Args:
+        degrees: Array of shape (T, 3)
+        max_terms: Maximum index value (cube truncation, as compute_degree_specific_series)
+        chunk: Triples per vectorised block
+    
+    Returns:
+        Dictionary of columns: degrees (T,3), S (T,), error_bound (T,)
+    """
+    degrees = np.atleast_2d(np.asarray(degrees, dtype=float))
+    if degrees.shape[1] != 3:
+        raise ValueError(f"degrees must have shape (T, 3), got {degrees.shape}")
+    if np.any(degrees < 0):
+        raise ValueError("degree exponents must be non-negative")
+    return {
+        'degrees': degrees,
+        'S': _contract(base_term_tensor(max_terms), degrees, chunk),
+        'error_bound': truncation_error_bound(degrees, max_terms, chunk)
+    }
+
+
 def triple_series_term(m: int, n: int, p: int) -> float:
     """
     Compute single term of triple series
@@ -82,34 +325,20 @@ def compute_triple_series(max_terms: int = 30, verbose: bool = False) -> Tuple[f
     Returns:
         (final_sum, partial_sums_history)
     """
-    S = 0.0
-    partial_sums = []
+    shells = series_shells((1, 2, 3), max_terms)
+    partial_sums = [float(v) for v in np.cumsum(shells[1:max_terms + 1])]
     
-    # Track contributions by total order
-    for total_order in range(1, max_terms + 1):
-        order_contribution = 0.0
-        count = 0
-        
-        # Sum over all (m,n,p) with m+n+p = total_order
-        for m in range(total_order + 1):
-            for n in range(total_order + 1 - m):
-                p = total_order - m - n
-                if p >= 0:
-                    term = triple_series_term(m, n, p)
-                    order_contribution += term
-                    count += 1
-        
-        S += order_contribution
-        partial_sums.append(S)
-        
-        if verbose and total_order % 5 == 0:
-            print(f"Order {total_order:2d}: contribution = {order_contribution:+.6e}, "
-                  f"sum = {S:+.6e}, terms = {count}")
+    if verbose:
+        for total_order in range(5, max_terms + 1, 5):
+            count = (total_order + 1) * (total_order + 2) // 2
+            print(f"Order {total_order:2d}: contribution = {shells[total_order]:+.6e}, "
+                  f"sum = {partial_sums[total_order - 1]:+.6e}, terms = {count}")
     
-    return S, partial_sums
+    return partial_sums[-1], partial_sums
 
 
-def compute_degree_specific_series(a: int, b: int, c: int, max_terms: int = 30) -> float:
+def compute_degree_specific_series(a: int, b: int, c: int, max_terms: int = 30,
+                                   precision: str = "float") -> float:
     """
     Compute series with specific degree parameters (a,b,c)
     
@@ -124,34 +353,13 @@ def compute_degree_specific_series(a: int, b: int, c: int, max_terms: int = 30)
     Args:
         a, b, c: Degree parameters for m, n, p
         max_terms: Maximum index value
+        precision: "float", "exact" (Fraction) or "mpmath"
     
     Returns:
         Series sum
     """
-    S = 0.0
-    
-    for m in range(max_terms + 1):
-        for n in range(max_terms + 1):
-            for p in range(max_terms + 1):
-                if m == 0 and n == 0 and p == 0:
-                    continue
-                
-                # Modified term with degree parameters
-                sign = (-1)**(m + n + p)
-                field_weights = (m**a) * (n**b) * (p**c)
-                octave_ratio = 2**(n - p)
-                
-                total_order = m + n + p
-                factorial_damping = math.factorial(total_order)
-                trinity_factor = 3**m
-                
-                numerator = sign * field_weights * octave_ratio
-                denominator = factorial_damping * trinity_factor
-                
-                term = numerator / denominator
-                S += term
-    
-    return S
+    S = series_shells((a, b, c), max_terms, precision).sum()
+    return float(S) if precision == "float" else S
 
 
 def analyze_convergence(max_orders: list = [10, 15, 20, 25, 30]) -> dict:
@@ -163,12 +371,15 @@ def analyze_convergence(max_orders: list = [10, 15, 20, 25, 30]) -> dict:
     """
     results = {}
     
+    # One pass at the largest order; every smaller truncation is a prefix
+    _, partials = compute_triple_series(max_terms=max(max_orders), verbose=False)
+    
     for max_order in max_orders:
-        S, partials = compute_triple_series(max_terms=max_order, verbose=False)
+        S = partials[max_order - 1]
         
         # Estimate convergence rate
-        if len(partials) > 1:
-            last_change = abs(partials[-1] - partials[-2])
+        if max_order > 1:
+            last_change = abs(partials[max_order - 1] - partials[max_order - 2])
         else:
             last_change = abs(S)
         
@@ -0,0 +1,26 @@
+import numpy as np
+from fractions import Fraction
+from src.analysis.higher_traces.traces import compute_all_higher_traces, create_ufrf_cycle_operator
+
+def test_charpoly_matches_exterior_powers():
+    A = np.random.default_rng(3).standard_normal((7, 7))
+    fast = compute_all_higher_traces(A)
+    slow = compute_all_higher_traces(A, method="exterior")
+    assert np.allclose(fast, slow, atol=1e-10)
+
+def test_exact_traces_of_integer_operator():
+    A = np.array([[2, 1, 0], [1, 3, 1], [0, 1, 4]])
+    lambdas = compute_all_higher_traces(A, method="exact")
+    assert list(lambdas) == [Fraction(1), Fraction(9), Fraction(24), Fraction(18)]
+
+def test_n13_cycle_operator_determinant():
+    A = create_ufrf_cycle_operator(13)
+    assert abs(compute_all_higher_traces(A)[13] - np.linalg.det(A)) < 1e-12
+
+def test_chunked_isotropy_estimator_converges_to_identity():
+    from src.analysis.higher_traces.traces import isotropy_monte_carlo
+    mc = isotropy_monte_carlo(5, num_samples=50000, chunk_size=7000, rng=np.random.default_rng(0))
+    assert [c[0] for c in mc['convergence']][-1] == 50000
+    assert np.allclose(mc['T_eta'], np.eye(5), atol=6 * mc['std_error'].max())
+    errors = [c[1] for c in mc['convergence']]
+    assert errors[-1] < 0.05 and errors[-1] < errors[0]
@@ -0,0 +1,19 @@
+import numpy as np
+from src.analysis.hyperbolicity_positivity import (disformal_metric, disformal_metric_batch, lorentzian,
+                                                   lorentzian_batch, scan_batch)
+
+def test_metric_stack_matches_single_trial_metric():
+    rng = np.random.default_rng(1)
+    E, B = rng.uniform(-0.1, 0.1, (8, 3)), rng.uniform(-0.1, 0.1, (8, 3))
+    a, b, c = rng.uniform(-0.1, 0.1, 8), rng.uniform(-0.1, 0.1, 8), rng.uniform(0, 0.1, 8)
+    dphi = np.array([0.3, -0.2, 0.1, 0.5])
+    g = disformal_metric_batch(E, B, a, b, c, dphi)
+    for t in range(8):
+        g1 = disformal_metric(E[t], B[t], a[t], b[t], c[t], dphi)
+        assert np.allclose(g[t], g1) and lorentzian_batch(g[t:t+1])[0] == lorentzian(g1)
+
+def test_scan_reports_seeded_pass_fraction_with_interval():
+    res = scan_batch(0.005, 0.005, 0.005, 0.005, trials=2000, rng=np.random.default_rng(0))
+    again = scan_batch(0.005, 0.005, 0.005, 0.005, trials=2000, rng=np.random.default_rng(0))
+    assert res == again and res["pass_fraction"] == 1.0
+    assert res["ci"][0] > 0.99 and res["ci"][1] == 1.0
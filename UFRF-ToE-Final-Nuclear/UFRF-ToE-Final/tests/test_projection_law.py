@@ -0,0 +1,16 @@
+import numpy as np
+from src.core.projection_law import ProjectionLaw
+
+def test_array_projection_is_seeded_and_matches_scalar_law():
+    values = np.linspace(0.5, 2.0, 6)
+    scales = ProjectionLaw().nested_scale(np.arange(6))
+    cols = ProjectionLaw(rng=np.random.default_rng(7)).project_observations(values, scales, 0.0016)
+    again = ProjectionLaw(rng=np.random.default_rng(7)).project_observations(values, scales, 0.0016)
+    assert np.array_equal(cols['observed_value'], again['observed_value'])
+    expected = np.log(values) + cols['scale_separation'] * (1 / 137.036) * 0.0016 + cols['noise']
+    assert np.allclose(np.log(cols['observed_value']), expected)
+    assert cols['scale_separation'][3] == 0.0
+
+def test_scalar_wrappers_return_floats():
+    obs, details = ProjectionLaw(rng=np.random.default_rng(0)).cross_scale_projection(1.272, 6)
+    assert isinstance(obs, float) and isinstance(details['scale_separation'], float)
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from scipy import integrate, stats
+from src.analysis.quasi_arithmetic.means import bayes_error_from_samples, bayes_error_gaussian, bayes_error_matrix
+
+def test_gaussian_bayes_error_matches_integral_of_min_density():
+    x = np.linspace(-40, 40, 400001)
+    for mu1, s1, mu2, s2 in [(0, 1, 1.5, 1), (2, 1, 0, 1), (0, 1, 0.5, 2), (1, 0.3, -1, 3)]:
+        p = np.minimum(stats.norm.pdf(x, mu1, s1), stats.norm.pdf(x, mu2, s2))
+        assert abs(bayes_error_gaussian(mu1, s1, mu2, s2) - 0.5 * integrate.trapezoid(p, x)) < 1e-7
+    assert bayes_error_gaussian(0, 1, 0, 1) == 0.5
+    # large common offset: only μ₂ - μ₁ matters
+    assert abs(bayes_error_gaussian(1e8, 1, 1e8 + 1, 1) - stats.norm.cdf(-0.5)) < 1e-12
+    assert abs(bayes_error_gaussian(1e8, 1, 1e8 + 0.5, 2) - bayes_error_gaussian(0, 1, 0.5, 2)) < 1e-12
+
+def test_bayes_error_matrix_is_symmetric_pairwise_kernel():
+    mu, sigma = np.array([0.0, 3.0, -1.0]), np.array([1.0, 0.5, 2.0])
+    Pe = bayes_error_matrix(mu, sigma)
+    assert np.allclose(Pe, Pe.T) and np.allclose(np.diag(Pe), 0.5)
+    assert np.isclose(Pe[0, 2], bayes_error_gaussian(0.0, 1.0, -1.0, 2.0))
+
+def test_kde_bayes_error_tracks_gaussian_and_streams():
+    from src.analysis.quasi_arithmetic.kde_bayes import BinnedDensity, bayes_error_binned
+    rng = np.random.default_rng(3)
+    a, b = rng.normal(0, 1, 200000), rng.normal(1.5, 1, 200000)
+    Pe = bayes_error_from_samples(a, b, assume_gaussian=False)
+    assert abs(Pe - bayes_error_gaussian(0, 1, 1.5, 1)) < 5e-3
+    d1, d2 = BinnedDensity(a.min(), b.max()), BinnedDensity(a.min(), b.max())
+    for k in range(0, a.size, 50000):
+        d1.update(a[k:k + 50000]); d2.update(b[k:k + 50000])
+    assert abs(bayes_error_binned(d1, d2) - Pe) < 1e-3
+    from src.analysis.quasi_arithmetic.kde_bayes import kde_bayes_error
+    a_inf = np.concatenate([a, [np.inf, -np.inf, np.nan]])
+    assert kde_bayes_error(a_inf, b) == kde_bayes_error(a, b)
+    with pytest.raises(ValueError):
+        kde_bayes_error(np.array([np.inf, np.nan]), b)
+
+def test_batched_means_match_per_array_means_over_ragged_offsets():
+    from src.analysis.quasi_arithmetic.means import (GENERATORS, factorial_generator,
+                                                     quasi_arithmetic_mean, quasi_arithmetic_means)
+    flat = np.array([1.0, 2.0, 4.0, 8.0, 3.0, 5.0])
+    offsets = np.array([0, 4, 4, 6])
+    M = quasi_arithmetic_means(flat, ['harmonic', 'geometric', 'arithmetic'], offsets=offsets)
+    for k, name in enumerate(['harmonic', 'geometric', 'arithmetic']):
+        for p in (0, 2):
+            seg = flat[offsets[p]:offsets[p + 1]]
+            assert np.isclose(M[k, p], quasi_arithmetic_mean(seg, *GENERATORS[name]))
+        assert M[k, 1] == 0.0
+    assert np.allclose(factorial_generator(np.array([0.0, 3.0, 5.5])), [0.0, 0.5, 5.5 / 120])
+
+def test_affinity_is_degenerate_over_the_shared_multiset():
+    from src.analysis.quasi_arithmetic.means import (arithmetic_generator, arithmetic_generator_inv,
+                                                     compute_affinity, emergence_threshold,
+                                                     geometric_generator, geometric_generator_inv)
+    x, y = np.array([1.0, 2.0, 3.0]), np.array([10.0, 20.0, 30.0])
+    assert compute_affinity(x, y, geometric_generator, geometric_generator_inv) == 1.0
+    assert compute_affinity(np.array([-1.0]), np.array([1.0]), arithmetic_generator, arithmetic_generator_inv) == np.inf
+    res = emergence_threshold([x, y, x + 5], geometric_generator, geometric_generator_inv)
+    assert res['affinities'] == [1.0, 1.0, 1.0]
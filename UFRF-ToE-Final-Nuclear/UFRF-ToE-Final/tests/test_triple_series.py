@@ -0,0 +1,26 @@
+import math
+import numpy as np
+from src.topology.triple_series import (compute_degree_series_batch, compute_degree_specific_series,
+                                        compute_triple_series, scan_degree_grid, triple_series_term)
+
+def test_shell_partial_sums_match_term_by_term_orders():
+    _, partials = compute_triple_series(max_terms=12)
+    for order in (1, 6, 12):
+        direct = sum(triple_series_term(m, n, s - m - n)
+                     for s in range(1, order + 1) for m in range(s + 1) for n in range(s + 1 - m))
+        assert math.isclose(partials[order - 1], direct, rel_tol=1e-12, abs_tol=1e-15)
+
+def test_batched_degrees_agree_with_exact_rationals():
+    degrees = np.array([(1, 1, 1), (2, 2, 2), (0, 0, 0), (1, 2, 3)])
+    batch = compute_degree_series_batch(degrees, max_terms=15)
+    for (a, b, c), S in zip(degrees, batch):
+        exact = compute_degree_specific_series(a, b, c, max_terms=15, precision="exact")
+        assert math.isclose(S, float(exact), rel_tol=1e-10, abs_tol=1e-14)
+
+def test_degree_grid_scan_matches_batch_and_bounds_truncation():
+    degrees = np.array([(1, 2, 3), (4, 4, 4), (0, 0, 0), (2.5, 1, 0.5)])
+    scan = scan_degree_grid(degrees, max_terms=10)
+    assert np.allclose(scan['S'][:3], compute_degree_series_batch(degrees[:3].astype(int), max_terms=10),
+                       rtol=1e-10, atol=1e-14)
+    converged = scan_degree_grid(degrees, max_terms=40)['S']
+    assert np.all(np.abs(scan['S'] - converged) <= scan['error_bound'])
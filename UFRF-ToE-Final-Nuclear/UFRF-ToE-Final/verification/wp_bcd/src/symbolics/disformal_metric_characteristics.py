@@ -1,6 +1,7 @@
 
 import sympy as sp
-import random
+import numpy as np
+from functools import lru_cache
 
 def disformal_metric_matrix(a,b,c, E, B, dPhi):
     Ex,Ey,Ez = E
@@ -44,42 +45,107 @@ def cone_speed_along_x(g):
             vals.append(float(sp.re(v)))
     return sorted([abs(v) for v in vals])
 
-def find_safe_bounds(num_trials=30):
-    epsE = 0.2
+# Numeric fast path: the metric and the x-cone quadratic are derived symbolically once and
+# lambdified in (a,b,c,Ex,Ey,Ez,Bx,By,Bz,dt,d1,d2,d3); samples are then evaluated in batches.
+# With k = (w,1,0,0), k.g^{-1}.k = 0 is A w^2 + B w + C = 0 with (A,B,C) = (adj00, adj01+adj10, adj11)
+# of the adjugate, since g^{-1} = adj(g)/det(g) and the overall factor does not move the roots
+# (g is not symmetric in general: the b term is η F Fᵀ).
+
+ARGS = sp.symbols('a b c Ex Ey Ez Bx By Bz dt d1 d2 d3', real=True)
+
+@lru_cache(maxsize=None)
+def numeric_kernels():
+    a, b, c, Ex, Ey, Ez, Bx, By, Bz, dt, d1, d2, d3 = ARGS
+    g = disformal_metric_matrix(a, b, c, (Ex, Ey, Ez), (Bx, By, Bz), (dt, d1, d2, d3))
+    coeffs = [g.cofactor(0,0), g.cofactor(0,1) + g.cofactor(1,0), g.cofactor(1,1)]
+    return sp.lambdify(ARGS, list(g), 'numpy'), sp.lambdify(ARGS, coeffs, 'numpy', cse=True)
+
+def _columns(a, b, c, E, B, dPhi):
+    # per-sample arrays in ARGS order; E, B are (...,3) and dPhi is (...,4)
+    E, B, dPhi = (np.asarray(v, dtype=float) for v in (E, B, dPhi))
+    cols = [a, b, c, *np.moveaxis(E, -1, 0), *np.moveaxis(B, -1, 0), *np.moveaxis(dPhi, -1, 0)]
+    return np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in cols))
+
+def disformal_metric_batch(a, b, c, E, B, dPhi):
+    # (...,4,4) numeric metrics
+    cols = _columns(a, b, c, E, B, dPhi)
+    entries = numeric_kernels()[0](*cols)
+    return np.stack([np.broadcast_to(e, cols[0].shape) for e in entries], axis=-1).reshape(cols[0].shape + (4,4))
+
+def cone_speeds_along_x_batch(a, b, c, E, B, dPhi, tol=1e-9):
+    # sorted |w| of the real roots, shape (...,2); NaN where a root is complex (or absent)
+    cols = _columns(a, b, c, E, B, dPhi)
+    A, Bq, C = (np.broadcast_to(v, cols[0].shape).astype(float) for v in numeric_kernels()[1](*cols))
+    disc = Bq*Bq - 4*A*C
+    scale = np.maximum(Bq*Bq, np.abs(4*A*C))
+    real = disc >= -tol*scale
+    sq = np.sqrt(np.maximum(disc, 0.0))
+    q = -0.5*(Bq + np.where(Bq >= 0, sq, -sq))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r1 = np.where(A != 0, q/A, np.nan)
+        r2 = np.where(q != 0, C/q, np.nan)
+    speeds = np.sort(np.abs(np.stack([r1, r2], axis=-1)), axis=-1)
+    return np.where(real[..., None], speeds, np.nan)
+
+def lorentzian_batch(g, tol=1e-8):
+    # real parts of the (general) eigenvalues, as the SymPy eigenvals check
+    w = np.linalg.eigvals(g).real
+    return (np.sum(w < -tol, axis=-1) == 1) & (np.sum(w > tol, axis=-1) == 3)
+
+def sample_window(n, rng, epsE=0.2, ea=0.03, eb=0.005, ec=0.01):
+    # the small-parameter REST window of find_safe_bounds, n draws at once
+    Ex = rng.uniform(-epsE, epsE, n)
+    Ey = rng.uniform(-epsE, epsE, n)
+    Ey = np.where(Ex**2+Ey**2 < 1e-6, epsE, Ey)
+    # Perp B in xy-plane with |B|=|E| (rotating E by 90 degrees keeps the norm)
+    E = np.stack([Ex, Ey, np.zeros(n)], axis=-1)
+    B = np.stack([-Ey, Ex, np.zeros(n)], axis=-1)
+    # Timelike ∂Φ: dt dominates spatial parts
+    dPhi = np.stack([rng.uniform(0.05, 0.2, n), *rng.uniform(-0.05, 0.05, (3, n))], axis=-1)
+    a = rng.uniform(-ea, ea, n)
+    b = rng.uniform(0, eb, n)
+    c = rng.uniform(0, ec, n)
+    return a, b, c, E, B, dPhi
+
+def crosscheck_symbolic(a, b, c, E, B, dPhi, speeds, rtol=1e-7):
+    # re-derive cone speeds with the SymPy path for a few samples; max relative deviation
+    dev = 0.0
+    for i in range(len(a)):
+        g = disformal_metric_matrix(float(a[i]), float(b[i]), float(c[i]), tuple(map(float, E[i])),
+                                    tuple(map(float, B[i])), tuple(map(float, dPhi[i])))
+        ref = cone_speed_along_x(g)
+        fast = [v for v in speeds[i] if not np.isnan(v)]
+        if len(ref) != len(fast):
+            return np.inf
+        if ref:
+            dev = max(dev, float(np.max(np.abs(np.array(ref) - fast)/np.maximum(np.abs(ref), 1e-300))))
+    return dev
+
+def find_safe_bounds(num_trials=30, rng=None, crosscheck=3, chunk=1 << 16):
     # Coeff bounds tuned for robust subluminality
-    ea, eb, ec = 0.03, 0.005, 0.01   # |a|≤0.03, 0≤b≤0.005, 0≤c≤0.01
-    for _ in range(num_trials):
-        Ex = random.uniform(-epsE, epsE)
-        Ey = random.uniform(-epsE, epsE)
-        if Ex**2+Ey**2 < 1e-6:
-            Ey = epsE
-        # Perp B in xy-plane with |B|=|E|
-        Bx, By = -Ey, Ex
-        s = (Bx*Bx+By*By)**0.5
-        scale = ((Ex**2+Ey**2)**0.5)/(s if s else 1.0)
-        Bx,By,Bz = Bx*scale, By*scale, 0.0
-        Ez = 0.0
-        # Timelike ∂Φ: dt dominates spatial parts
-        dt = random.uniform(0.05, 0.2)
-        d1 = random.uniform(-0.05, 0.05)
-        d2 = random.uniform(-0.05, 0.05)
-        d3 = random.uniform(-0.05, 0.05)
-        a = random.uniform(-ea, ea)
-        b = random.uniform(0, eb)
-        c = random.uniform(0, ec)
-        g = disformal_metric_matrix(a,b,c,
-                                    (Ex,Ey,Ez),
-                                    (Bx,By,Bz),
-                                    (dt,d1,d2,d3))
+    #   |E|=|B|≤0.2·√2 in the xy-plane, |a|≤0.03, 0≤b≤0.005, 0≤c≤0.01
+    rng = np.random.default_rng() if rng is None else rng
+    for start in range(0, num_trials, chunk):
+        a, b, c, E, B, dPhi = sample_window(min(chunk, num_trials - start), rng)
+        g = disformal_metric_batch(a, b, c, E, B, dPhi)
         # Signature: one negative, three positive
-        evals = [complex(ev.evalf()) for ev in g.eigenvals().keys()]
-        neg = sum(1 for ev in evals if ev.real < -1e-8)
-        pos = sum(1 for ev in evals if ev.real >  1e-8)
-        if not (neg==1 and pos==3):
-            return False, {"a":a,"b":b,"c":c,"evals":[str(e) for e in evals]}
+        lor = lorentzian_batch(g)
         # Cone along x
-        speeds = cone_speed_along_x(g)
-        if len(speeds)<2 or speeds[-1] > 1.0 + 1e-7:
-            return False, {"a":a,"b":b,"c":c,"speeds":speeds}
+        speeds = cone_speeds_along_x_batch(a, b, c, E, B, dPhi)
+        sub = np.all(~np.isnan(speeds), axis=-1) & (speeds[:, -1] <= 1.0 + 1e-7)
+        if start == 0 and crosscheck:
+            k = min(crosscheck, len(a))
+            dev = crosscheck_symbolic(a[:k], b[:k], c[:k], E[:k], B[:k], dPhi[:k], speeds[:k])
+            if not dev <= 1e-7:
+                return False, {"crosscheck_deviation": dev}
+        bad = np.flatnonzero(~(lor & sub))
+        if bad.size:
+            i = bad[0]
+            info = {"a":float(a[i]),"b":float(b[i]),"c":float(c[i])}
+            if not lor[i]:
+                info["evals"] = [str(e) for e in np.linalg.eigvals(g[i])]
+            else:
+                info["speeds"] = [float(v) for v in speeds[i] if not np.isnan(v)]
+            return False, info
     return True, {"bounds":{"E_B_bound":0.2,"grad_phi_timelike":"dt in [0.05,0.2], |spatial|<=0.05",
                             "|a|≤":0.03,"0≤b≤":0.005,"0≤c≤":0.01}}
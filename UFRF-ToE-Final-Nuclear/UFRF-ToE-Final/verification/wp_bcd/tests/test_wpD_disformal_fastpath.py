@@ -0,0 +1,29 @@
+
+import sys, os, importlib
+import numpy as np
+THIS = os.path.dirname(__file__); ROOT = os.path.abspath(os.path.join(THIS, os.pardir))
+sys.path.insert(0, ROOT)
+
+dm = importlib.import_module("src.symbolics.disformal_metric_characteristics")
+
+def _samples(n=4, seed=11):
+    return dm.sample_window(n, np.random.default_rng(seed))
+
+def test_fast_cone_speeds_match_sympy():
+    a, b, c, E, B, dPhi = _samples()
+    speeds = dm.cone_speeds_along_x_batch(a, b, c, E, B, dPhi)
+    assert dm.crosscheck_symbolic(a, b, c, E, B, dPhi, speeds) <= 1e-7
+
+def test_lorentzian_batch_matches_sympy_eigenvalues():
+    a, b, c, E, B, dPhi = _samples()
+    # one sample pushed out of the window so that both signature outcomes are compared
+    c[-1] = 1e4
+    lor = dm.lorentzian_batch(dm.disformal_metric_batch(a, b, c, E, B, dPhi))
+    for i in range(len(a)):
+        g = dm.disformal_metric_matrix(float(a[i]), float(b[i]), float(c[i]), tuple(map(float, E[i])),
+                                       tuple(map(float, B[i])), tuple(map(float, dPhi[i])))
+        evals = [complex(ev.evalf()) for ev in g.eigenvals().keys()]
+        neg = sum(1 for ev in evals if ev.real < -1e-8)
+        pos = sum(1 for ev in evals if ev.real >  1e-8)
+        assert lor[i] == (neg == 1 and pos == 3)
+    assert lor[:-1].all() and not lor[-1]
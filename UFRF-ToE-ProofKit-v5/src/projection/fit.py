@@ -1,8 +1,7 @@
 
-import numpy as np
+import sys, pathlib
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[3] / "UFRF-ToE-ProofKit-v8" / "src"))
+from ufrf.projection.fit import fit_projection_batch
 def fit_projection(scales, observations, alphas):
-    scales=np.asarray(scales,float); obs=np.asarray(observations,float); a=np.asarray(alphas,float)
-    y=np.log(obs); X=np.column_stack([np.ones_like(scales), a*np.log(scales)])
-    coef,*_ = np.linalg.lstsq(X,y,rcond=None); lnO,S=coef
-    resid=y - X@coef
-    return {"O_star":float(np.exp(lnO)),"S":float(S),"stderr":float(np.sqrt(np.mean(resid**2)))}
+    fit=fit_projection_batch(scales,observations,alphas)
+    return {"O_star":float(fit["O_star"]),"S":float(fit["S"]),"stderr":float(fit["stderr"])}
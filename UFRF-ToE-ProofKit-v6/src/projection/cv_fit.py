@@ -1,5 +1,6 @@
 
 import numpy as np, math
+from statistics import NormalDist
 
 def fit_S_difference(data, clusters, t1, t2, dM, a1, a2):
     # y = ΔlnM = dM * (a1 - a2) * S + ε  -> slope S via least squares on a constant regressor
@@ -7,8 +8,11 @@ def fit_S_difference(data, clusters, t1, t2, dM, a1, a2):
     y = []
     for cl in clusters:
         y.append(data[cl][t1] - data[cl][t2])
-    y = np.array(y, dtype=float)
-    c = dM*(a1 - a2)
+    return fit_S_deltas(y, dM*(a1 - a2))
+
+def fit_S_deltas(y, c):
+    # fit_S_difference on an array of pair differences y with design constant c = dM*(a1-a2)
+    y = np.asarray(y, dtype=float)
     if abs(c) < 1e-12:
         return {"S": 0.0, "stderr": float(np.std(y))}
     S_hat = float(np.mean(y)/c)
@@ -17,3 +21,57 @@ def fit_S_difference(data, clusters, t1, t2, dM, a1, a2):
 
 def predict_difference(dM, S, a1, a2):
     return dM*(a1 - a2)*S
+
+def resample_weights(n, B, method="bootstrap", rng=None):
+    # (B, n) cluster multiplicities: multinomial counts for the bootstrap, leave-one-out for the jackknife
+    if method == "bootstrap":
+        rng = np.random.default_rng() if rng is None else rng
+        return rng.multinomial(n, np.full(n, 1.0/n), size=B).astype(float)
+    if method == "jackknife":
+        return 1.0 - np.eye(n)
+    raise ValueError(f"unknown resampling method {method!r}")
+
+def fit_S_weighted(Y, c, W):
+    # Y: (P, n) pair differences over a common cluster axis, NaN where a cluster lacks the pair;
+    # c: (P,) design constants dM*(a1-a2); W: (B, n) weights -> (B, P) replicate S of fit_S_difference
+    Y = np.atleast_2d(np.asarray(Y, dtype=float)); c = np.atleast_1d(np.asarray(c, dtype=float))
+    have = ~np.isnan(Y)
+    num = W @ np.where(have, Y, 0.0).T
+    den = W @ have.T.astype(float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        S = num/den/c
+    return np.where(np.abs(c) < 1e-12, 0.0, S)
+
+def _resample_chunk(job):
+    Y, c, B, method, seed = job
+    return fit_S_weighted(Y, c, resample_weights(Y.shape[1], B, method, np.random.default_rng(seed)))
+
+def resample_S(Y, c, B=1000, method="bootstrap", seed=0, workers=1, chunk=10000):
+    # replicate S for every pair; bootstrap replicates are drawn in chunks of `chunk`
+    # (independent SeedSequence streams) and spread over a process pool when workers > 1
+    Y = np.atleast_2d(np.asarray(Y, dtype=float))
+    if method == "jackknife":
+        return fit_S_weighted(Y, c, resample_weights(Y.shape[1], None, "jackknife"))
+    sizes = [min(chunk, B - i) for i in range(0, B, chunk)]
+    jobs = [(Y, c, b, method, ss) for b, ss in zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes)))]
+    if workers > 1 and len(jobs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            parts = list(ex.map(_resample_chunk, jobs))
+    else:
+        parts = [_resample_chunk(j) for j in jobs]
+    return np.concatenate(parts, axis=0)
+
+def summarize_replicates(theta, reps, method="bootstrap", level=0.95):
+    # percentile interval for the bootstrap; jackknife variance with a normal interval
+    reps = np.asarray(reps, dtype=float)
+    if method == "jackknife":
+        n = len(reps)
+        se = float(np.sqrt((n - 1)/n*np.sum((reps - reps.mean())**2)))
+        z = NormalDist().inv_cdf((1 + level)/2)
+        ci = [theta - z*se, theta + z*se]
+    else:
+        se = float(np.std(reps, ddof=1))
+        ci = [float(v) for v in np.quantile(reps, [(1 - level)/2, (1 + level)/2])]
+    return {"method": method, "level": level, "n_rep": int(len(reps)), "se": se, "ci": ci,
+            "rep_mean": float(reps.mean())}
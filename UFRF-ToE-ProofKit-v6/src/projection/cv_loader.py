@@ -1,6 +1,7 @@
 
 import json, csv, math
 from collections import defaultdict
+import numpy as np
 
 def load_splits(json_path):
     with open(json_path) as f:
@@ -17,7 +18,54 @@ def load_dataset(csv_path):
             data[cl][tech] = float(row["ln_mass"])
     return data
 
+class TechTable:
+    # columnar cluster x technique table: values[i, j] = ln_mass of cluster i by tech j, NaN if absent.
+    # Rows keep first-appearance order of the CSV; pair availability is a column AND of `present`.
+    def __init__(self, clusters, techs, values):
+        self.clusters = np.asarray(clusters, dtype=object)
+        self.techs = list(techs)
+        self.col = {t: j for j, t in enumerate(self.techs)}
+        self.values = np.asarray(values, dtype=float)
+        self.present = ~np.isnan(self.values)
+        self.pair_counts = self.present.T.astype(np.int64) @ self.present   # clusters per (t1, t2)
+        self._masks = {}
+
+    def __len__(self):
+        return len(self.clusters)
+
+    def pair_mask(self, t1, t2):
+        key = (t1, t2) if t1 <= t2 else (t2, t1)
+        if key not in self._masks:
+            self._masks[key] = self.present[:, self.col[t1]] & self.present[:, self.col[t2]]
+        return self._masks[key]
+
+    def pair_deltas(self, t1, t2):
+        m = self.pair_mask(t1, t2)
+        return self.clusters[m], self.values[m, self.col[t1]] - self.values[m, self.col[t2]]
+
+    def pair_matrix(self, pairs):
+        # (P, n) differences over the clusters carrying at least one of the pairs, NaN where missing
+        masks = np.array([self.pair_mask(t1, t2) for t1, t2 in pairs]).reshape(len(pairs), len(self))
+        rows = masks.any(axis=0)
+        Y = np.array([self.values[rows, self.col[t1]] - self.values[rows, self.col[t2]] for t1, t2 in pairs])
+        return np.where(masks[:, rows], Y.reshape(len(pairs), -1), np.nan), self.clusters[rows]
+
+def load_table(csv_path):
+    clusters, techs, rows, cols, vals = {}, {}, [], [], []
+    with open(csv_path) as f:
+        r = csv.DictReader(f)
+        for row in r:
+            rows.append(clusters.setdefault(row["cluster"], len(clusters)))
+            cols.append(techs.setdefault(row["tech"], len(techs)))
+            vals.append(float(row["ln_mass"]))
+    values = np.full((len(clusters), len(techs)), np.nan)
+    values[rows, cols] = vals   # a repeated (cluster, tech) keeps its last row, as load_dataset
+    return TechTable(list(clusters), list(techs), values)
+
 def pair_deltas(data, t1, t2):
+    if isinstance(data, TechTable):
+        X, Y = data.pair_deltas(t1, t2)
+        return list(X), list(Y)
     X=[]; Y=[]
     for cl, rec in data.items():
         if t1 in rec and t2 in rec:
@@ -0,0 +1,164 @@
+import json, os, hashlib
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from src.projection.cv_fit import fit_S_deltas, predict_difference, resample_S, summarize_replicates
+
+# Splits config -> split jobs -> (t1, t2, cluster-set) fit jobs.  Fits shared by several splits
+# are computed once (memo keyed by the pair and a digest of its cluster mask); split jobs then
+# run on a process pool and stream to JSONL.  Each split record carries a content key (split
+# spec, priors, dM, resampling settings and the data columns it reads), so a rerun against an
+# existing JSONL only recomputes splits whose key changed.
+
+def _digest(*parts):
+    h = hashlib.sha1()
+    for p in parts:
+        h.update(p if isinstance(p, bytes) else json.dumps(p, sort_keys=True, default=str).encode())
+    return h.hexdigest()[:16]
+
+def expand_splits(cfg):
+    # one job per LOTO split; one per training pair of a PAIRWISE split (id suffixed when there are several)
+    jobs = []
+    for sp in cfg["splits"]:
+        sid = sp["id"]
+        if sid.startswith("LOTO_"):
+            ref = sp["ref"]
+            jobs.append({"id": sid, "stat": "S_avg", "train_pairs": [[t, ref] for t in sp["train"]],
+                         "holdout_pairs": [[sp["holdout"][0], ref]], "pair_in_preds": False, "spec": sp})
+        elif sid.startswith("PAIRWISE"):
+            pairs = sp.get("train_pairs", [])
+            for t1, t2 in pairs:
+                jid = sid if len(pairs) == 1 else f"{sid}__{t1}__{t2}"
+                jobs.append({"id": jid, "stat": "S_hat", "train_pairs": [[t1, t2]],
+                             "holdout_pairs": sp.get("holdout_pairs", []), "pair_in_preds": True, "spec": sp})
+    return jobs
+
+def _preds(table, hp1, hp2, dM, S, priors, pair):
+    clusters, y_obs = table.pair_deltas(hp1, hp2)
+    y_hat = predict_difference(dM, S, priors[hp1], priors[hp2])
+    extra = {"pair": [hp1, hp2]} if pair else {}
+    return [{"cluster": cl, **extra, "y_hat": y_hat, "y_obs": float(y), "resid": float(y - y_hat)}
+            for cl, y in zip(clusters, y_obs)]
+
+_TABLE = None
+
+def _init_worker(table):
+    global _TABLE
+    _TABLE = table
+
+def evaluate_split(job, fits, priors, dM, rs, table=None, workers=1):
+    # predictions and (optionally) resampled uncertainty for one split, given its precomputed pair fits;
+    # `workers` > 1 spreads the bootstrap chunks of this split over a process pool
+    table = _TABLE if table is None else table
+    S_hats = [fits[tuple(p)]["S"] for p in job["train_pairs"]]
+    theta = float(sum(S_hats)/len(S_hats)) if S_hats else 0.0
+    preds = []
+    for hp1, hp2 in job["holdout_pairs"]:
+        preds += _preds(table, hp1, hp2, dM, theta, priors, job["pair_in_preds"])
+    unc, reps = None, None
+    if rs is not None and job["train_pairs"]:
+        Y, _ = table.pair_matrix(job["train_pairs"])
+        c = np.array([dM*(priors[t1] - priors[t2]) for t1, t2 in job["train_pairs"]])
+        with np.errstate(invalid="ignore"):
+            reps = np.nanmean(resample_S(Y, c, rs["B"], rs["method"], rs["seed"], workers,
+                                         rs.get("chunk", 10000)), axis=1)
+        reps = reps[~np.isnan(reps)]
+        unc = summarize_replicates(theta, reps, rs["method"], rs["level"])
+    return {"id": job["id"], job["stat"]: theta, "S_uncertainty": unc, "preds": preds}, reps
+
+class CVScheduler:
+    def __init__(self, table, priors, dM, rs=None, workers=1, jsonl_path=None):
+        self.table, self.priors, self.dM = table, priors, dM
+        self.rs, self.workers, self.jsonl_path = rs, workers, jsonl_path
+        self.memo = {}
+        self.stats = {"fits_requested": 0, "fits_computed": 0, "splits_reused": 0, "splits_computed": 0}
+
+    def fit(self, t1, t2):
+        self.stats["fits_requested"] += 1
+        key = (t1, t2, _digest(np.packbits(self.table.pair_mask(t1, t2)).tobytes()))
+        if key not in self.memo:
+            self.stats["fits_computed"] += 1
+            self.memo[key] = fit_S_deltas(self.table.pair_deltas(t1, t2)[1],
+                                          self.dM*(self.priors[t1] - self.priors[t2]))
+        return self.memo[key]
+
+    def split_key(self, job):
+        techs = sorted({t for p in job["train_pairs"] + job["holdout_pairs"] for t in p})
+        cols = [self.table.col[t] for t in techs]
+        data = self.table.values[:, cols]
+        return _digest(job["id"], job["spec"], {t: self.priors[t] for t in techs}, self.dM, self.rs,
+                       [str(c) for c in self.table.clusters], data.tobytes())
+
+    def _replicate_path(self, key):
+        return os.path.join(os.path.dirname(self.jsonl_path) or ".", "cv_replicates", key + ".npy")
+
+    def _load_previous(self):
+        prev = {}
+        if self.jsonl_path and os.path.exists(self.jsonl_path):
+            with open(self.jsonl_path) as f:
+                for line in f:
+                    if line.strip():
+                        rec = json.loads(line)
+                        prev[rec["key"]] = rec
+        return prev
+
+    def run(self, cfg):
+        jobs = expand_splits(cfg)
+        keys = [self.split_key(j) for j in jobs]
+        prev = self._load_previous()
+        records, replicates = {}, {}
+
+        todo = []
+        for job, key in zip(jobs, keys):
+            if key in prev and (self.rs is None or os.path.exists(self._replicate_path(key))):
+                records[key] = prev[key]
+                self.stats["splits_reused"] += 1
+            else:
+                todo.append((job, key))
+        fits = {key: {tuple(p): self.fit(*p) for p in job["train_pairs"]} for job, key in todo}
+
+        out = None
+        if self.jsonl_path:
+            os.makedirs(os.path.dirname(self.jsonl_path) or ".", exist_ok=True)
+            # keep the reusable records, then stream new ones as they finish
+            with open(self.jsonl_path, "w") as f:
+                for key in keys:
+                    if key in records:
+                        f.write(json.dumps(records[key]) + "\n")
+            out = open(self.jsonl_path, "a")
+
+        def emit(key, rec, reps):
+            rec = {**rec, "key": key}
+            records[key] = rec
+            self.stats["splits_computed"] += 1
+            if out:
+                out.write(json.dumps(rec) + "\n"); out.flush()
+                if reps is not None:
+                    os.makedirs(os.path.dirname(self._replicate_path(key)), exist_ok=True)
+                    np.save(self._replicate_path(key), reps)
+            if reps is not None:
+                replicates[rec["id"]] = reps
+
+        try:
+            # the pool goes to whichever level has more work: across splits when there are at least
+            # as many pending splits as workers, otherwise serial splits with pooled bootstrap chunks
+            # (replicates depend only on seed and chunk, never on the worker count)
+            if self.workers > 1 and len(todo) >= self.workers:
+                with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                         initargs=(self.table,)) as ex:
+                    futs = {ex.submit(evaluate_split, job, fits[key], self.priors, self.dM, self.rs): key
+                            for job, key in todo}
+                    for fut in as_completed(futs):
+                        emit(futs[fut], *fut.result())
+            else:
+                for job, key in todo:
+                    emit(key, *evaluate_split(job, fits[key], self.priors, self.dM, self.rs, self.table,
+                                              self.workers))
+        finally:
+            if out:
+                out.close()
+
+        for key in keys:
+            rec = records[key]
+            if rec["id"] not in replicates and self.rs is not None and self.jsonl_path:
+                replicates[rec["id"]] = np.load(self._replicate_path(key))
+        return [records[k] for k in keys], replicates
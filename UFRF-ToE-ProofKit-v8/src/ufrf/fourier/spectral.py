@@ -0,0 +1,75 @@
+"""
+Shared spectral analysis for the 13/26 loop-size diagnostics.
+
+Conventions (common to every function here): sequences run along the last axis,
+so a (..., n) array is a batch of spectra computed in one call; the mean is
+removed first (detrend=True); "power" is the magnitude |F| used by the original
+scanners (squared=True gives |F|^2); frequencies are in cycles per sample, so
+a period-13 signal sits at f = 1/13.
+"""
+import numpy as np
+
+WINDOWS = {
+    "boxcar": np.ones,
+    "hann": np.hanning,
+    "hamming": np.hamming,
+    "blackman": np.blackman,
+}
+
+
+def window(n, kind="boxcar"):
+    if kind not in WINDOWS:
+        raise ValueError(f"unknown window {kind!r}; expected one of {sorted(WINDOWS)}")
+    return WINDOWS[kind](n)
+
+
+def _prepare(seq, kind, detrend, axes):
+    arr = np.asarray(seq, dtype=float)
+    if detrend:
+        arr = arr - np.mean(arr, axis=axes, keepdims=True)
+    for ax in axes:
+        shape = [1]*arr.ndim
+        shape[ax] = arr.shape[ax]
+        arr = arr * window(arr.shape[ax], kind).reshape(shape)
+    return arr
+
+
+def _magnitude(F, squared):
+    return np.abs(F)**2 if squared else np.abs(F)
+
+
+def rfft_freqs(n, pad_to=None):
+    return np.fft.rfftfreq(max(n, pad_to or 0))
+
+
+def rfft_power(seq, kind="boxcar", pad_to=None, detrend=True, squared=False):
+    """Spectrum of (..., n) sequences on the rfft_freqs(n, pad_to) grid, zero-padded to pad_to."""
+    arr = _prepare(seq, kind, detrend, (-1,))
+    return _magnitude(np.fft.rfft(arr, n=max(arr.shape[-1], pad_to or 0), axis=-1), squared)
+
+
+def rfft2_power(W, kind="boxcar", pad_to=None, detrend=True, squared=False):
+    """2D spectrum over the last two axes of W; pad_to is an optional (rows, cols) FFT shape."""
+    arr = _prepare(W, kind, detrend, (-2, -1))
+    s = None if pad_to is None else tuple(max(a, b) for a, b in zip(arr.shape[-2:], pad_to))
+    return _magnitude(np.fft.rfft2(arr, s=s, axes=(-2, -1)), squared)
+
+
+def goertzel(seq, freq, kind="boxcar", detrend=True, squared=False):
+    """
+    Exact DTFT |sum_j x_j e^{-2 pi i f j}| of (..., n) sequences at one frequency f,
+    evaluated with the Goertzel recurrence (O(n), no rounding of f onto the FFT grid).
+    """
+    arr = _prepare(seq, kind, detrend, (-1,))
+    w = 2.0*np.pi*freq
+    coeff = 2.0*np.cos(w)
+    s1 = np.zeros(arr.shape[:-1])
+    s2 = np.zeros(arr.shape[:-1])
+    for j in range(arr.shape[-1]):
+        s1, s2 = arr[..., j] + coeff*s1 - s2, s1
+    return _magnitude(s1 - np.exp(-1j*w)*s2, squared)
+
+
+def period_peaks(seq, periods=(13, 26), **kw):
+    """{period: goertzel(seq, 1/period)} for the UFRF target periods."""
+    return {p: goertzel(seq, 1.0/p, **kw) for p in periods}
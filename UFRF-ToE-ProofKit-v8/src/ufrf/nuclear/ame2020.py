@@ -0,0 +1,129 @@
+"""
+Vectorised AME2020 mass-table loader with a hash-keyed binary cache.
+
+The fixed-width lines are laid out as one (lines, width) unicode array and
+every column is sliced and converted for all rows at once.  The result is a
+structured array (AME_DTYPE) that keeps estimated values: '#' stands for the
+decimal point of an estimated (non-experimental) value and sets an ESTIMATED_*
+flag; '*' (not calculable) gives NaN and a MISSING_* flag, so experimental
+rows are `flags == 0`.  The array is saved as `<sha1-of-source>.npy` in the
+cache directory and later loads are a (memory-mapped) np.load.
+"""
+import hashlib
+import os
+
+import numpy as np
+
+PARSER_VERSION = 1
+
+ESTIMATED_MASS = 1
+ESTIMATED_BINDING = 2
+MISSING_MASS = 4
+MISSING_BINDING = 8
+
+AME_DTYPE = np.dtype([("Z", "i4"), ("N", "i4"), ("A", "i4"), ("element", "U3"),
+                      ("mass_excess", "f8"), ("binding_per_A", "f8"), ("binding_total", "f8"),
+                      ("flags", "u1")])
+
+# (start, stop) character columns, as in the mass-table header
+COLUMNS = {"NZ": (0, 4), "N": (4, 9), "Z": (9, 14), "A": (14, 19), "element": (20, 23),
+           "mass_excess": (29, 43), "binding_per_A": (54, 67)}
+MIN_LINE = 100   # shorter lines (header text) are skipped
+
+
+def file_hash(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _field(rows, name):
+    a, b = COLUMNS[name]
+    return np.char.strip(rows.view(f"U1").reshape(len(rows), -1)[:, a:b].copy().view(f"U{b - a}").ravel())
+
+
+def _convert(strs, kind):
+    """strs.astype(kind) with a per-element fallback that marks unparsable entries invalid."""
+    try:
+        return strs.astype(kind), np.ones(len(strs), dtype=bool)
+    except ValueError:
+        out = np.zeros(len(strs), dtype=kind)
+        ok = np.zeros(len(strs), dtype=bool)
+        for i, s in enumerate(strs):
+            try:
+                out[i] = kind(s)
+                ok[i] = True
+            except ValueError:
+                pass
+        return out, ok
+
+
+def _value(strs, estimated_flag, missing_flag):
+    est = np.char.find(strs, "#") >= 0
+    missing = np.char.find(strs, "*") >= 0
+    vals, ok = _convert(np.where(missing, "nan", np.char.replace(strs, "#", ".")), float)
+    flags = np.where(est, estimated_flag, 0) | np.where(missing, missing_flag, 0)
+    return vals, ok, flags.astype(np.uint8)
+
+
+def parse_lines(lines):
+    """Parse mass-table lines (newline kept, as file iteration yields them) into AME_DTYPE."""
+    lines = [ln for ln in lines if len(ln) >= MIN_LINE and ln[0] not in "01"]
+    if not lines:
+        return np.zeros(0, dtype=AME_DTYPE)
+    width = max(len(ln) for ln in lines)
+    rows = np.array(lines, dtype=f"U{width}")
+
+    ints = {}
+    ok = np.ones(len(rows), dtype=bool)
+    for name in ("NZ", "N", "Z", "A"):
+        ints[name], good = _convert(_field(rows, name), int)
+        ok &= good
+    mass, good_m, flags_m = _value(_field(rows, "mass_excess"), ESTIMATED_MASS, MISSING_MASS)
+    bpa, good_b, flags_b = _value(_field(rows, "binding_per_A"), ESTIMATED_BINDING, MISSING_BINDING)
+    ok &= good_m & good_b
+
+    out = np.zeros(int(ok.sum()), dtype=AME_DTYPE)
+    for name in ("Z", "N", "A"):
+        out[name] = ints[name][ok]
+    out["element"] = _field(rows, "element")[ok]
+    out["mass_excess"] = mass[ok]
+    out["binding_per_A"] = bpa[ok]
+    out["binding_total"] = bpa[ok]*out["A"]
+    out["flags"] = (flags_m | flags_b)[ok]
+    return out
+
+
+def read_lines(path):
+    with open(path, "r") as f:
+        return list(f)
+
+
+def default_cache_dir(path):
+    return os.path.join(os.path.dirname(os.path.abspath(path)), ".ame_cache")
+
+
+def load_ame2020(path, cache_dir=None, use_cache=True, mmap=True):
+    """
+    AME_DTYPE array for the mass table at `path`, cached as
+    <cache_dir>/<sha1>-v<PARSER_VERSION>.npy (default cache_dir: .ame_cache next to the file).
+    """
+    if not use_cache:
+        return parse_lines(read_lines(path))
+    cache_dir = default_cache_dir(path) if cache_dir is None else cache_dir
+    cached = os.path.join(cache_dir, f"{file_hash(path)}-v{PARSER_VERSION}.npy")
+    if os.path.exists(cached):
+        return np.load(cached, mmap_mode="r" if mmap else None)
+    table = parse_lines(read_lines(path))
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f"{cached}.{os.getpid()}.tmp.npy"
+    np.save(tmp, table)
+    os.replace(tmp, cached)
+    return table
+
+
+def experimental(table):
+    """Rows with measured mass excess and binding energy (what the dict parser kept)."""
+    return table[table["flags"] == 0]
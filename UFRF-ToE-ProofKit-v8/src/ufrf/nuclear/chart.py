@@ -0,0 +1,81 @@
+"""
+Dense (Z, N) nuclide chart for separation energies and shell-gap scans.
+
+Binding energies sit on a (Zmax+1, Nmax+1) float array with NaN where no
+nuclide is tabulated.  Separation energies are shifted differences along the
+N axis (S_n, S_2n) or the Z axis (S_p, S_2p), so anything touching a hole is
+NaN.  A shell gap is the drop S(k) - S(k') between consecutive tabulated
+entries of the same chain (isotopes for n/2n, isotones for p/2p), the same
+pairing as walking each chain sorted by N or Z.  Energies are in keV on the
+grid; gap tables are in MeV.
+"""
+import numpy as np
+
+# kind -> (axis along which nucleons are removed, number removed)
+SEPARATIONS = {"n": (1, 1), "2n": (1, 2), "p": (0, 1), "2p": (0, 2)}
+
+
+class NuclideChart:
+    def __init__(self, Z, N, binding_total, element=None):
+        Z = np.asarray(Z, dtype=np.int64)
+        N = np.asarray(N, dtype=np.int64)
+        self.BE = np.full((Z.max() + 1, N.max() + 1), np.nan)
+        self.BE[Z, N] = binding_total   # repeated (Z, N): last entry wins, as a dict lookup would
+        self.element = np.full(Z.max() + 1, "", dtype="U3")
+        if element is not None:
+            self.element[Z] = element
+        self._sep = {}
+
+    @classmethod
+    def from_table(cls, table):
+        """From an AME_DTYPE array (see ufrf.nuclear.ame2020) or anything with those fields."""
+        return cls(table["Z"], table["N"], table["binding_total"], table["element"])
+
+    @property
+    def present(self):
+        return ~np.isnan(self.BE)
+
+    def separation(self, kind="n"):
+        """S_kind(Z, N) in keV on the chart grid, NaN where either nuclide is missing."""
+        if kind not in SEPARATIONS:
+            raise ValueError(f"unknown separation {kind!r}; expected one of {sorted(SEPARATIONS)}")
+        if kind not in self._sep:
+            axis, k = SEPARATIONS[kind]
+            S = np.full(self.BE.shape, np.nan)
+            if axis == 1:
+                S[:, k:] = self.BE[:, k:] - self.BE[:, :-k]
+            else:
+                S[k:, :] = self.BE[k:, :] - self.BE[:-k, :]
+            self._sep[kind] = S
+        return self._sep[kind]
+
+    def gaps(self, kind="n", min_gap_mev=None):
+        """
+        Drops between consecutive tabulated separation energies along each chain,
+        as columns: chain (Z for n/2n, N for p/2p), before, after, S_before, S_after,
+        gap_mev; optionally only gaps >= min_gap_mev.
+        """
+        axis, _ = SEPARATIONS[kind]
+        S = self.separation(kind)
+        S = S if axis == 1 else S.T
+        chain, pos = np.nonzero(~np.isnan(S))   # row-major: chain, then increasing position
+        vals = S[chain, pos]
+        same = chain[1:] == chain[:-1]
+        before, after = vals[:-1][same], vals[1:][same]
+        out = {"chain": chain[:-1][same], "before": pos[:-1][same], "after": pos[1:][same],
+               "S_before": before/1000.0, "S_after": after/1000.0, "gap_mev": (before - after)/1000.0}
+        if min_gap_mev is not None:
+            keep = out["gap_mev"] >= min_gap_mev
+            out = {k: v[keep] for k, v in out.items()}
+        return out
+
+    def gap_window(self, kind="n", lo=13.75, hi=14.25):
+        """Gaps with lo <= gap_mev <= hi."""
+        g = self.gaps(kind)
+        keep = (g["gap_mev"] >= lo) & (g["gap_mev"] <= hi)
+        return {k: v[keep] for k, v in g.items()}
+
+    def gap_counts(self, thresholds, kind="n"):
+        """Number of gaps >= each threshold, for a whole threshold scan in one searchsorted."""
+        g = np.sort(self.gaps(kind)["gap_mev"])
+        return len(g) - np.searchsorted(g, np.asarray(thresholds, dtype=float), side="left")
@@ -0,0 +1,56 @@
+"""
+Projection-law calibration: ln O = ln O* + (α ln r)·S + ε is a straight line in
+x = α ln r, so every fit reduces to RegressionMoments sufficient statistics.
+fit_projection_batch fits a (..., n) stack of datasets (bootstrap replicates,
+techniques, scale windows) in one vectorised closed-form solve;
+ProjectionFitStream accumulates one or many datasets chunk by chunk.
+"""
+import numpy as np
+
+from .streaming import RegressionMoments
+
+
+def projection_xy(scales, observations, alphas):
+    scales = np.asarray(scales, dtype=float)
+    obs = np.asarray(observations, dtype=float)
+    alphas = np.asarray(alphas, dtype=float)
+    if np.any(obs <= 0):
+        raise ValueError("Observations must be positive for log.")
+    return alphas*np.log(scales), np.log(obs)
+
+
+def _result(mom):
+    sol = mom.solve()
+    return {"O_star": np.exp(sol["c0"]), "S": sol["c1"], "stderr": sol["rms"],
+            "lnO_star": sol["c0"], "se_lnO_star": sol["se_c0"], "se_S": sol["se_c1"],
+            "cov": sol["cov"], "n": mom.W}
+
+
+def fit_projection_batch(scales, observations, alphas, weights=None):
+    """
+    Fit every dataset along the last axis of the broadcast (..., n) inputs.
+    weights (same shape) are per-datum multiplicities, e.g. bootstrap counts.
+    Returns a dict of arrays with the leading shape: O_star, S, stderr (rms
+    residual, as fit_projection), lnO_star, se_lnO_star, se_S, cov (..., 2, 2), n.
+    """
+    x, y = projection_xy(scales, observations, alphas)
+    shape = np.broadcast_shapes(x.shape, y.shape, np.shape(1.0 if weights is None else weights))
+    return _result(RegressionMoments(shape[:-1]).update(x, y, weights))
+
+
+class ProjectionFitStream:
+    """Chunked projection fit of `shape` independent datasets; mergeable across workers."""
+
+    def __init__(self, shape=()):
+        self.moments = RegressionMoments(shape)
+
+    def update(self, scales, observations, alphas, weights=None):
+        self.moments.update(*projection_xy(scales, observations, alphas), weights)
+        return self
+
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        return self
+
+    def result(self):
+        return _result(self.moments)
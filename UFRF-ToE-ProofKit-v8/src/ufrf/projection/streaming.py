@@ -0,0 +1,179 @@
+"""
+Mergeable streaming statistics for chunked Monte Carlo runs.
+
+Each accumulator is fed whole NumPy blocks (update) and combines with a
+partial result from another chunk or worker process (merge), so a run never
+holds more than one block of samples.  Moments use the Chan et al. parallel
+form of Welford's update; quantiles come from a fixed-range histogram sketch
+whose merge is exact (bin counts add).
+"""
+import numpy as np
+
+
+class RunningMoments:
+    """Count, mean, M2 (sum of squared deviations), min and max of a stream."""
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.M2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def _combine(self, n, mean, M2, lo, hi):
+        if n == 0:
+            return self
+        total = self.n + n
+        delta = mean - self.mean
+        self.M2 += M2 + delta*delta*self.n*n/total
+        self.mean += delta*n/total
+        self.n = total
+        self.min = min(self.min, lo)
+        self.max = max(self.max, hi)
+        return self
+
+    def update(self, x):
+        x = np.asarray(x, dtype=float).ravel()
+        if x.size == 0:
+            return self
+        m = float(x.mean())
+        d = x - m
+        return self._combine(x.size, m, float(d @ d), float(x.min()), float(x.max()))
+
+    def merge(self, other):
+        return self._combine(other.n, other.mean, other.M2, other.min, other.max)
+
+    @property
+    def var(self):
+        """Population variance (statistics.pvariance convention)."""
+        return self.M2/self.n if self.n else float("nan")
+
+    @property
+    def std(self):
+        return float(np.sqrt(self.var))
+
+    @property
+    def sem(self):
+        return float(np.sqrt(self.M2/(self.n - 1)/self.n)) if self.n > 1 else float("nan")
+
+    def to_dict(self):
+        return {"n": self.n, "mean": self.mean, "std": self.std, "sem": self.sem,
+                "min": self.min, "max": self.max}
+
+
+class HistogramSketch:
+    """
+    Quantile sketch on a fixed [lo, hi] grid of `bins` equal bins, plus
+    under/overflow counts.  Quantiles interpolate linearly inside a bin, so the
+    error is at most one bin width for values inside the range.
+    """
+
+    def __init__(self, lo, hi, bins=4096):
+        if not hi > lo:
+            raise ValueError(f"empty sketch range [{lo}, {hi}]")
+        self.lo, self.hi, self.bins = float(lo), float(hi), int(bins)
+        self.counts = np.zeros(self.bins + 2, dtype=np.int64)   # [under, bins..., over]
+
+    @property
+    def width(self):
+        return (self.hi - self.lo)/self.bins
+
+    def update(self, x):
+        x = np.asarray(x, dtype=float).ravel()
+        idx = np.floor((x - self.lo)/self.width).astype(np.int64) + 1
+        self.counts += np.bincount(np.clip(idx, 0, self.bins + 1), minlength=self.bins + 2)
+        return self
+
+    def merge(self, other):
+        if (other.lo, other.hi, other.bins) != (self.lo, self.hi, self.bins):
+            raise ValueError("cannot merge sketches on different grids")
+        self.counts += other.counts
+        return self
+
+    def quantile(self, q):
+        """Quantiles for q in [0, 1]; nan when q falls in the under/overflow mass."""
+        q = np.atleast_1d(np.asarray(q, dtype=float))
+        cdf = np.cumsum(self.counts)
+        target = np.clip(q*cdf[-1], np.nextafter(0.0, 1.0), cdf[-1])
+        k = np.searchsorted(cdf, target, side="left")
+        below = np.where(k > 0, cdf[np.maximum(k - 1, 0)], 0)
+        frac = np.where(self.counts[k] > 0, (target - below)/np.maximum(self.counts[k], 1), 0.0)
+        out = self.lo + (k - 1 + frac)*self.width
+        return np.where((k == 0) | (k == self.bins + 1), np.nan, out)
+
+
+class RegressionMoments:
+    """
+    Sufficient statistics of the straight-line fit y = c0 + c1*x for a batch of
+    independent datasets (leading axes), kept as weight W, means and centred
+    co-moments Cxx, Cxy, Cyy; the same information as (Σ1, Σx, Σx², Σy, Σxy, Σy²)
+    but merged in the Chan form, so residual sums do not cancel catastrophically.
+    """
+
+    def __init__(self, shape=()):
+        self.W = np.zeros(shape)
+        self.mx = np.zeros(shape)
+        self.my = np.zeros(shape)
+        self.Cxx = np.zeros(shape)
+        self.Cxy = np.zeros(shape)
+        self.Cyy = np.zeros(shape)
+
+    def _combine(self, W, mx, my, Cxx, Cxy, Cyy):
+        total = self.W + W
+        f = np.divide(self.W*W, total, out=np.zeros_like(total), where=total > 0)
+        g = np.divide(W, total, out=np.zeros_like(total), where=total > 0)
+        dx, dy = mx - self.mx, my - self.my
+        self.Cxx = self.Cxx + Cxx + f*dx*dx
+        self.Cxy = self.Cxy + Cxy + f*dx*dy
+        self.Cyy = self.Cyy + Cyy + f*dy*dy
+        self.mx = self.mx + g*dx
+        self.my = self.my + g*dy
+        self.W = total
+        return self
+
+    def update(self, x, y, w=None):
+        """Add a chunk of (..., m) samples (optionally weighted, e.g. bootstrap counts)."""
+        x, y, w = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float),
+                                      np.asarray(1.0 if w is None else w, dtype=float))
+        W = w.sum(axis=-1)
+        safe = np.where(W > 0, W, 1.0)
+        mx = (w*x).sum(axis=-1)/safe
+        my = (w*y).sum(axis=-1)/safe
+        dx, dy = x - mx[..., None], y - my[..., None]
+        return self._combine(W, mx, my, (w*dx*dx).sum(axis=-1), (w*dx*dy).sum(axis=-1),
+                             (w*dy*dy).sum(axis=-1))
+
+    def merge(self, other):
+        return self._combine(other.W, other.mx, other.my, other.Cxx, other.Cxy, other.Cyy)
+
+    def solve(self):
+        """
+        Closed-form 2x2 solve for every dataset: intercept c0, slope c1, residual
+        sum of squares ssr, rms residual sqrt(ssr/W), covariance sigma^2 (X'X)^-1
+        with sigma^2 = ssr/(W-2), and the standard errors se_c0, se_c1.
+
+        Degenerate datasets are handled explicitly, without warnings:
+        Cxx == 0 (all x equal) falls back to the intercept-only fit c0 = mean y,
+        c1 = 0, with sigma^2 = ssr/(W-1) and NaN slope variances; when fewer
+        degrees of freedom remain than parameters (W <= 2, or W <= 1 for the
+        intercept-only fit) the covariance and standard errors are NaN;
+        an empty dataset (W == 0) is NaN throughout.
+        """
+        line = self.Cxx > 0
+        Cxx = np.where(line, self.Cxx, 1.0)
+        c1 = np.where(line, self.Cxy/Cxx, 0.0)
+        c0 = self.my - c1*self.mx
+        ssr = np.maximum(self.Cyy - c1*self.Cxy, 0.0)
+        dof = self.W - np.where(line, 2.0, 1.0)
+        sigma2 = np.where(dof > 0, ssr/np.where(dof > 0, dof, 1.0), np.nan)
+        W = np.where(self.W > 0, self.W, np.nan)
+        var_c1 = np.where(line, sigma2/Cxx, np.nan)
+        cov = np.empty(np.shape(c1) + (2, 2))
+        cov[..., 1, 1] = var_c1
+        cov[..., 0, 1] = cov[..., 1, 0] = -self.mx*var_c1
+        cov[..., 0, 0] = sigma2/W + np.where(line, self.mx*self.mx*var_c1, 0.0)
+        empty = ~(self.W > 0)
+        c0 = np.where(empty, np.nan, c0)
+        c1 = np.where(empty, np.nan, c1)
+        return {"c0": c0, "c1": c1, "ssr": ssr, "rms": np.sqrt(ssr/W), "cov": cov,
+                "se_c0": np.sqrt(cov[..., 0, 0]), "se_c1": np.sqrt(cov[..., 1, 1])}
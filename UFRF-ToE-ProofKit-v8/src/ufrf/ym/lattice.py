@@ -0,0 +1,273 @@
+"""
+Array-backed SU(3) link store and batched Wilson-loop kernels.
+
+Links are held as contiguous (N, N, 3, 3) complex arrays indexed [y, x], the
+same layout as the nested Ux[y][x] lists of the IMVP gauge scanners, so a loop
+of a given shape is evaluated for all N^2 base sites with one batched matmul
+per edge instead of N^2 Python-level walks.
+"""
+import hashlib
+import math
+import numpy as np
+
+
+def gell_mann():
+    Z = np.zeros((3,3), dtype=complex)
+    l1 = Z.copy(); l1[0,1]=l1[1,0]=1
+    l2 = Z.copy(); l2[0,1]=-1j; l2[1,0]=1j
+    l3 = Z.copy(); l3[0,0]=1; l3[1,1]=-1
+    l4 = Z.copy(); l4[0,2]=l4[2,0]=1
+    l5 = Z.copy(); l5[0,2]=-1j; l5[2,0]=1j
+    l6 = Z.copy(); l6[1,2]=l6[2,1]=1
+    l7 = Z.copy(); l7[1,2]=-1j; l7[2,1]=1j
+    l8 = (1/np.sqrt(3))*np.diag([1,1,-2]).astype(complex)
+    return np.array([l1,l2,l3,l4,l5,l6,l7,l8])
+
+LAM = gell_mann()
+
+# Harmonic of each algebra component in the period-modulated link profile:
+# (sin φ, cos φ, sin 2φ, cos 2φ, sin 3φ, cos 3φ, sin 4φ, cos 4φ).
+HARMONICS = np.array([1, 1, 2, 2, 3, 3, 4, 4])
+IS_SIN = np.array([True, False]*4)
+
+
+def su3_algebra(theta):
+    """G = sum_a theta[..., a] * lambda_a / 2 for a (..., 8) theta array."""
+    return np.einsum('...a,aij->...ij', np.asarray(theta, dtype=float), LAM) / 2.0
+
+
+def su3_exp(Q):
+    """
+    exp(iQ) for traceless Hermitian (..., 3, 3) Q, batched and exact.
+
+    Cayley-Hamilton closed form of Morningstar & Peardon (PRD 69, 054501):
+    exp(iQ) = f0 + f1 Q + f2 Q^2 with f_j from c0 = det Q and c1 = tr(Q^2)/2.
+    The result is special unitary to rounding, with no series truncation or SVD.
+    """
+    Q = np.asarray(Q, dtype=complex)
+    Q2 = Q @ Q
+    c0 = np.trace(Q2 @ Q, axis1=-2, axis2=-1).real / 3.0
+    c1 = np.trace(Q2, axis1=-2, axis2=-1).real / 2.0
+    neg = c0 < 0
+    c0 = np.abs(c0)
+    small = c1 < 1e-8
+    c1s = np.where(small, 1.0, c1)
+    theta = np.arccos(np.clip(c0 / (2.0*(c1s/3.0)**1.5), -1.0, 1.0))
+    u = np.sqrt(c1s/3.0)*np.cos(theta/3.0)
+    w = np.sqrt(c1s)*np.sin(theta/3.0)
+    w2 = w*w
+    xi0 = np.where(np.abs(w) > 0.05, np.sin(w)/np.where(w == 0, 1.0, w),
+                   1.0 - w2/6.0*(1.0 - w2/20.0*(1.0 - w2/42.0)))
+    e2iu, emiu, cw = np.exp(2j*u), np.exp(-1j*u), np.cos(w)
+    den = 9.0*u*u - w2
+    f0 = ((u*u - w2)*e2iu + emiu*(8.0*u*u*cw + 2j*u*(3.0*u*u + w2)*xi0)) / den
+    f1 = (2.0*u*e2iu - emiu*(2.0*u*cw - 1j*(3.0*u*u - w2)*xi0)) / den
+    f2 = (e2iu - emiu*(cw + 3j*u*xi0)) / den
+    # near Q = 0: series through Q^4 reduced with Q^3 = c1 Q + c0
+    f0 = np.where(small, 1.0 - 1j*c0/6.0, f0)
+    f1 = np.where(small, 1j*(1.0 - c1/6.0) + c0/24.0, f1)
+    f2 = np.where(small, -0.5 + c1/24.0, f2)
+    # f_j(-c0) = (-1)^j conj(f_j(c0))
+    f0 = np.where(neg, np.conj(f0), f0)
+    f1 = np.where(neg, -np.conj(f1), f1)
+    f2 = np.where(neg, np.conj(f2), f2)
+    I = np.eye(3, dtype=complex)
+    return f0[..., None, None]*I + f1[..., None, None]*Q + f2[..., None, None]*Q2
+
+
+def expi_hermitian(H):
+    """exp(iH) for Hermitian (..., 3, 3) H: the trace part is split off as a U(1) phase."""
+    H = np.asarray(H, dtype=complex)
+    c = np.trace(H, axis1=-2, axis2=-1).real / 3.0
+    return np.exp(1j*c)[..., None, None] * su3_exp(H - c[..., None, None]*np.eye(3))
+
+
+def su3_expm_from_theta(theta):
+    """U = exp(i G), G = theta·lambda/2, for a (..., 8) theta array (exact, see su3_exp)."""
+    return su3_exp(su3_algebra(theta))
+
+
+def build_links(N, period=13, eps=0.12, seed=1, amps=(0.20, 0.16, 0.12, 0.10, 0.08, 0.06, 0.05, 0.04),
+                y_scale=0.9, noise=0.02):
+    """
+    Period-modulated near-identity SU(3) links on an N x N torus.
+    The per-site noise is drawn in the same (y, x, [x-link, y-link]) order as the
+    original site-by-site builders, so a given seed reproduces their lattices.
+    """
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:N, 0:N]
+    phase = (2.0*math.pi*(x+y)/float(period))[..., None] * HARMONICS
+    base = np.asarray(amps, dtype=float) * np.where(IS_SIN, np.sin(phase), np.cos(phase)) * eps
+    z = rng.standard_normal((N, N, 2, 8))
+    thx = base + noise*z[..., 0, :]
+    thy = y_scale*base + noise*z[..., 1, :]
+    return su3_expm_from_theta(thx), su3_expm_from_theta(thy)
+
+
+def random_su3(rng, shape, scale=0.25):
+    """Random SU(3) elements exp(i theta·lambda/2), theta ~ scale*N(0,1), for every index in shape."""
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    return su3_expm_from_theta(scale * rng.standard_normal(shape + (8,)))
+
+
+def shift(U, dx=0, dy=0):
+    """shift(U, dx, dy)[y, x] = U[y+dy, x+dx] with periodic boundaries."""
+    return np.roll(U, (-dy, -dx), axis=(-4, -3))
+
+
+def dagger(U):
+    return np.conj(np.swapaxes(U, -1, -2))
+
+
+def transporter(U, L, direction):
+    """Straight-line product U(s) U(s+e) ... U(s+(L-1)e) for every site s, e = +x or +y."""
+    step = (1, 0) if direction == "x" else (0, 1)
+    P = U
+    for k in range(1, L):
+        P = P @ shift(U, k*step[0], k*step[1])
+    return P
+
+
+def wilson_loops(Ux, Uy, R, T=None):
+    """All N^2 R x T Wilson loops (+x R, +y T, -x R, -y T), returned as (N, N, n, n)."""
+    T = R if T is None else T
+    return rectangle(transporter(Ux, R, "x"), transporter(Uy, T, "y"), R, T)
+
+
+def rectangle(X, Y, R, T):
+    """Close R x T loops from length-R x transporters X and length-T y transporters Y."""
+    return X @ shift(Y, dx=R) @ dagger(shift(X, dy=T)) @ dagger(Y)
+
+
+class WilsonLoopEngine:
+    """
+    Rectangular Wilson loops assembled from cached straight-line transporters.
+
+    The x and y transporters of length L are extended from those of length L-1 by
+    one shifted link product, so a sweep over R, T = 1..Lmax costs O(N^2 Lmax) link
+    multiplies plus three per rectangle, and every R x T average is memoised.
+    Cached transporters take 2 * Lmax * N^2 links of memory.  Subclasses swap the
+    group representation by overriding the mul/shift/rectangle/loop_traces hooks.
+    """
+    mul = staticmethod(np.matmul)
+    shift = staticmethod(shift)
+    rectangle = staticmethod(rectangle)
+
+    def __init__(self, Ux, Uy):
+        self.Ux, self.Uy = Ux, Uy
+        self._lines = {"x": [Ux], "y": [Uy]}
+        self._avg = {}
+
+    def line(self, L, direction):
+        """Transporter of length L along +x or +y for every base site (see transporter)."""
+        lines = self._lines[direction]
+        U = lines[0]
+        while len(lines) < L:
+            k = len(lines)
+            lines.append(self.mul(lines[-1], self.shift(U, dx=k) if direction == "x" else self.shift(U, dy=k)))
+        return lines[L-1]
+
+    def loops(self, R, T=None):
+        T = R if T is None else T
+        return self.rectangle(self.line(R, "x"), self.line(T, "y"), R, T)
+
+    def loop_traces(self, R, T=None):
+        """Normalised real trace of the R x T loop at every base site."""
+        return traces(self.loops(R, T))
+
+    def average(self, R, T=None):
+        T = R if T is None else T
+        if (R, T) not in self._avg:
+            self._avg[(R, T)] = float(np.mean(self.loop_traces(R, T)))
+        return self._avg[(R, T)]
+
+    def creutz_ratio(self, R, T=None):
+        """chi(R,T) = -ln[W(R+1,T+1) W(R,T) / (W(R+1,T) W(R,T+1))]; nan when not positive."""
+        T = R if T is None else T
+        num = self.average(R+1, T+1) * self.average(R, T)
+        den = self.average(R+1, T) * self.average(R, T+1)
+        if den <= 0 or num <= 0:
+            return float('nan')
+        return -math.log(num/den)
+
+
+ENGINE_CACHE_SIZE = 8
+_ENGINES = {}
+
+
+def fingerprint(Ux, Uy):
+    """Content hash of a lattice, used to key caches of derived loop data."""
+    h = hashlib.sha1()
+    for U in (Ux, Uy):
+        U = np.ascontiguousarray(U)
+        h.update(repr((U.shape, U.dtype.str)).encode())
+        h.update(U.tobytes())
+    return h.hexdigest()
+
+
+def loop_engine(Ux, Uy):
+    """WilsonLoopEngine shared by every caller holding the same lattice (keyed by fingerprint)."""
+    key = fingerprint(Ux, Uy)
+    if key not in _ENGINES:
+        if len(_ENGINES) >= ENGINE_CACHE_SIZE:
+            _ENGINES.pop(next(iter(_ENGINES)))
+        _ENGINES[key] = WilsonLoopEngine(Ux, Uy)
+    return _ENGINES[key]
+
+
+def loop_table(Ux, Uy, Rmax, Tmax=None):
+    """W[R-1, T-1] = <Re tr W(R,T)>/n over true R x T rectangles, each computed once per lattice."""
+    Tmax = Rmax if Tmax is None else Tmax
+    engine = loop_engine(Ux, Uy)
+    return np.array([[engine.average(R, T) for T in range(1, Tmax+1)] for R in range(1, Rmax+1)])
+
+
+def plaquettes(Ux, Uy):
+    return Ux @ shift(Uy, dx=1) @ dagger(shift(Ux, dy=1)) @ dagger(Uy)
+
+
+def traces(U):
+    """Normalised real traces Re tr(U)/n for every matrix in a (..., n, n) stack."""
+    return np.trace(U, axis1=-2, axis2=-1).real / U.shape[-1]
+
+
+def average_action_density(Ux, Uy):
+    return float(np.mean(1.0 - traces(plaquettes(Ux, Uy))))
+
+
+def avg_W(Ux, Uy, R, T=None):
+    return float(np.mean(traces(wilson_loops(Ux, Uy, R, T))))
+
+
+def gauge_transform(Ux, Uy, g):
+    """
+    U_mu(s) -> g(s) U_mu(s) g(s+mu)^dagger for a (..., N, N, n, n) stack of gauge fields g;
+    leading axes of g broadcast, so K transforms of one lattice run in a single pass.
+    """
+    return g @ Ux @ dagger(shift(g, dx=1)), g @ Uy @ dagger(shift(g, dy=1))
+
+
+def gauge_invariants(Ux, Uy, Lmax):
+    """Site-local invariant traces: plaquettes (..., N, N) and L x L loops, L = 1..Lmax, (..., Lmax, N, N)."""
+    engine = WilsonLoopEngine(Ux, Uy)
+    loops = np.stack([engine.loop_traces(L) for L in range(1, Lmax+1)], axis=-3)
+    return traces(plaquettes(Ux, Uy)), loops
+
+
+def gauge_invariance_scan(Ux, Uy, K, Lmax, rng, scale=0.4, chunk=32):
+    """
+    Apply K random gauge fields in vectorised chunks of `chunk` transforms and return,
+    per transform, the max |change| of the plaquette traces and loop traces at every
+    site ("plaquette", "loops", shape (K,)) and the relative change of each lattice
+    average W(L) ("W", shape (K, Lmax)).  Memory is bounded by the chunk size.
+    """
+    P0, L0 = gauge_invariants(Ux, Uy, Lmax)
+    W0 = L0.mean(axis=(-2, -1))
+    out = {"plaquette": [], "loops": [], "W": []}
+    for k0 in range(0, K, chunk):
+        g = random_su3(rng, (min(chunk, K-k0),) + Ux.shape[:2], scale)
+        P, Lt = gauge_invariants(*gauge_transform(Ux, Uy, g), Lmax)
+        out["plaquette"].append(np.abs(P - P0).max(axis=(-2, -1)))
+        out["loops"].append(np.abs(Lt - L0).max(axis=(-3, -2, -1)))
+        out["W"].append(np.abs(Lt.mean(axis=(-2, -1)) - W0) / np.maximum(1e-12, np.abs(W0)))
+    return {k: np.concatenate(v) for k, v in out.items()}
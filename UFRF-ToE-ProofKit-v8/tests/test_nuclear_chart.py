@@ -0,0 +1,83 @@
+import sys, pathlib
+import numpy as np
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+from ufrf.nuclear.ame2020 import COLUMNS, parse_lines, experimental, ESTIMATED_BINDING, MISSING_MASS
+from ufrf.nuclear.chart import NuclideChart
+
+def _line(Z, N, el, mass, bpa, lead=" "):
+    # one fixed-width mass-table row with each field right-aligned in its columns
+    buf = [" "]*120
+    for name, val in (("NZ", N - Z), ("N", N), ("Z", Z), ("A", N + Z), ("element", el),
+                      ("mass_excess", mass), ("binding_per_A", bpa)):
+        a, b = COLUMNS[name]
+        buf[a:b] = str(val).rjust(b - a)
+    buf[0] = lead
+    return "".join(buf) + "\n"
+
+def _synthetic_table():
+    bpa = {2: [1100.0, 2300.0, 2900.0, 4400.0, 4500.0, 4550.0, 4580.0],
+           3: [900.0, 2000.0, 3000.0, 3600.0, 3650.0, 5000.0, 5100.0]}
+    lines = ["1    header text that is long enough to pass the length cut".ljust(110) + "\n",
+             "short header\n"]
+    for Z, row in bpa.items():
+        for N, b in enumerate(row, start=1):
+            lines.append(_line(Z, N, "He" if Z == 2 else "Li", f"{1000.0*N + Z:.3f}", f"{b:.3f}"))
+    lines[5] = lines[5][:54] + "3000#000".rjust(13) + lines[5][67:]    # Z=2, N=4 estimated
+    lines[12] = lines[12][:29] + "*".rjust(14) + lines[12][43:]   # Z=3, N=4 not calculable
+    lines.append(_line(3, 9, "Li", "9003.000", "5200.000", lead="0"))  # page/line feed row
+    return lines
+
+def _old_parse(lines):
+    # the line-by-line dict parser ame2020_analysis used before the vectorised loader
+    nuclides = []
+    for line in lines:
+        if len(line) < 100 or line[0] in ['0', '1']:
+            continue
+        try:
+            N, Z, A = int(line[4:9]), int(line[9:14]), int(line[14:19])
+            mass = line[29:43].strip()
+            bpa = line[54:67].strip()
+            if '#' in mass or '*' in mass or '#' in bpa or '*' in bpa:
+                continue
+            nuclides.append({'N': N, 'Z': Z, 'element': line[20:23].strip(),
+                             'mass_excess': float(mass), 'binding_total': float(bpa)*A})
+        except (ValueError, IndexError):
+            continue
+    return nuclides
+
+def _old_gaps(nuclides, min_gap_mev):
+    # S_n by dict lookup, then consecutive drops along each isotope chain sorted by N
+    be = {(n['Z'], n['N']): n['binding_total'] for n in nuclides}
+    sn = {k: v - be[(k[0], k[1] - 1)] for k, v in be.items() if (k[0], k[1] - 1) in be}
+    gaps = []
+    for Z in sorted({z for z, _ in sn}):
+        chain = sorted((n, s) for (z, n), s in sn.items() if z == Z)
+        for (n0, s0), (n1, s1) in zip(chain, chain[1:]):
+            if (s0 - s1)/1000.0 >= min_gap_mev:
+                gaps.append((Z, n0, n1, s0/1000.0, s1/1000.0, (s0 - s1)/1000.0))
+    return gaps
+
+def test_parse_lines_matches_dict_parser_and_flags_estimates():
+    lines = _synthetic_table()
+    table = parse_lines(lines)
+    old = _old_parse(lines)
+    assert len(table) == 14 and not np.any((table["Z"] == 3) & (table["N"] == 9))
+    flagged = table[table["flags"] != 0]
+    assert sorted(zip(flagged["Z"], flagged["N"], flagged["flags"])) == [(2, 4, ESTIMATED_BINDING), (3, 4, MISSING_MASS)]
+    assert np.isclose(flagged["binding_per_A"][flagged["Z"] == 2][0], 3000.0)
+    assert np.isnan(flagged["mass_excess"][flagged["Z"] == 3][0])
+    exp = experimental(table)
+    assert [(int(r["Z"]), int(r["N"]), str(r["element"])) for r in exp] == [(n["Z"], n["N"], n["element"]) for n in old]
+    assert np.allclose(exp["mass_excess"], [n["mass_excess"] for n in old])
+    assert np.allclose(exp["binding_total"], [n["binding_total"] for n in old])
+
+def test_chart_gaps_match_sorted_chain_walk():
+    lines = _synthetic_table()
+    chart = NuclideChart.from_table(experimental(parse_lines(lines)))
+    for min_gap in (-np.inf, 0.0, 3.0):
+        g = chart.gaps("n", None if np.isinf(min_gap) else min_gap)
+        new = list(zip(g["chain"], g["before"], g["after"], g["S_before"], g["S_after"], g["gap_mev"]))
+        old = _old_gaps(_old_parse(lines), min_gap)
+        assert len(new) == len(old) and len(old) > 0
+        for a, b in zip(new, old):
+            assert a[:3] == b[:3] and np.allclose(a[3:], b[3:])
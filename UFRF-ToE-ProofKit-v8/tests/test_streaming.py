@@ -0,0 +1,26 @@
+import sys, pathlib, warnings
+import numpy as np
+sys.path.append(str(pathlib.Path(__file__).resolve().parents[1] / "src"))
+from ufrf.projection.streaming import RegressionMoments
+
+def _solve(x, y):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        return RegressionMoments().update(np.asarray(x, float), np.asarray(y, float)).solve()
+
+def test_regular_fit_matches_lstsq():
+    x, y = np.array([0.0, 1.0, 2.0, 4.0]), np.array([1.0, 2.9, 5.2, 8.8])
+    sol = _solve(x, y)
+    c, res, *_ = np.linalg.lstsq(np.c_[np.ones_like(x), x], y, rcond=None)
+    assert np.allclose([sol["c0"], sol["c1"]], c) and np.isclose(sol["ssr"], res[0])
+    assert np.isclose(sol["se_c1"], np.sqrt(res[0]/2/np.sum((x - x.mean())**2)))
+
+def test_equal_x_falls_back_to_intercept_only_fit():
+    sol = _solve([2.0, 2.0, 2.0], [1.0, 2.0, 3.0])
+    assert sol["c1"] == 0.0 and np.isclose(sol["c0"], 2.0) and np.isclose(sol["ssr"], 2.0)
+    assert np.isclose(sol["se_c0"], np.sqrt(1.0/3)) and np.isnan(sol["se_c1"])
+
+def test_two_points_give_exact_line_and_nan_errors():
+    sol = _solve([1.0, 3.0], [2.0, 6.0])
+    assert np.isclose(sol["c0"], 0.0) and np.isclose(sol["c1"], 2.0) and sol["ssr"] == 0.0
+    assert np.isnan(sol["se_c0"]) and np.isnan(sol["se_c1"]) and np.isnan(sol["cov"]).all()